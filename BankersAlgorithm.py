@@ -1,4 +1,9 @@
 import copy
+import heapq
+import time
+from collections import deque
+
+import Instrumentation
 
 
 # --- 1. HELPER FUNCTIONS ---
@@ -32,6 +37,202 @@ def is_need_met(process_index, Need , Work):
             return False
     return True
 
+def calculate_need(Max, Allocation):
+    # Need = Max - Allocation, checked so a process never holds more than its claim
+    if len(Max) != len(Allocation):
+        raise ValueError(f"Max has {len(Max)} rows but Allocation has {len(Allocation)}")
+    Need = []
+    for i, (max_row, alloc_row) in enumerate(zip(Max, Allocation)):
+        if len(max_row) != len(alloc_row):
+            raise ValueError(f"P{i}: Max and Allocation rows differ in length")
+        row = [mx - al for mx, al in zip(max_row, alloc_row)]
+        if any(need < 0 for need in row):
+            raise ValueError(f"P{i}: Allocation exceeds Max")
+        Need.append(row)
+    return Need
+
+
+def is_safe_state(Available, Allocation, Need):
+    # Returns (is_safe, safe_sequence) for the given state.
+    # safe_sequence lists process indices; when unsafe it holds the processes
+    # that could still finish before the system got stuck.
+    #
+    # Instead of rescanning from P0 after every grant, each resource keeps its
+    # processes sorted by Need, with a pointer past those Work already covers.
+    # Work only grows, so every pointer only moves forward. unmet[i] counts the
+    # resources P_i is still waiting on; at 0 it joins the ready heap. Popping the
+    # lowest ready index gives the same sequence as the classic scan, in
+    # O(n*m*log n) instead of O(n^2*m).
+    num_processes = len(Need)
+    num_resources = len(Available)
+
+    Work = list(Available)
+    queues = [sorted(range(num_processes), key=lambda i: Need[i][j]) for j in range(num_resources)]
+    pointers = [0] * num_resources
+    unmet = [num_resources] * num_processes
+    ready = []
+
+    def advance(j):
+        queue, pointer, work = queues[j], pointers[j], Work[j]
+        while pointer < num_processes and Need[queue[pointer]][j] <= work:
+            i = queue[pointer]
+            unmet[i] -= 1
+            if unmet[i] == 0:
+                heapq.heappush(ready, i)
+            pointer += 1
+        pointers[j] = pointer
+
+    for j in range(num_resources):
+        advance(j)
+    if num_resources == 0:
+        ready = list(range(num_processes))
+
+    safe_sequence = []
+    while ready:
+        i = heapq.heappop(ready)
+        safe_sequence.append(i)
+        # P_i finishes and hands back what it was holding
+        for j in range(num_resources):
+            if Allocation[i][j]:
+                Work[j] += Allocation[i][j]
+                advance(j)
+
+    if Instrumentation.profiler is not None:
+        # Every pointer step is one Need <= Work comparison that succeeded
+        Instrumentation.count("safety_checks")
+        Instrumentation.count("need_comparisons", sum(pointers))
+        Instrumentation.count("heap_pop", len(safe_sequence))
+    return len(safe_sequence) == num_processes, safe_sequence
+
+
+def bankers_algorithm(Max, Allocation, Available):
+    # Library entry point, no I/O: returns (is_safe, safe_sequence, Need)
+    Need = calculate_need(Max, Allocation)
+    for i, row in enumerate(Need):
+        if len(row) != len(Available):
+            raise ValueError(f"P{i}: expected {len(Available)} resources, got {len(row)}")
+    is_safe, safe_sequence = is_safe_state(Available, Allocation, Need)
+    return is_safe, safe_sequence, Need
+
+
+class BankersState:
+    # Long-lived Banker's state answering request/release calls in place.
+    #
+    # The last known safe sequence is kept between calls. Granting v to P_i only
+    # lowers Work for the processes ahead of P_i in that sequence (P_i's own need
+    # drops by v too, and everything after it sees the same Work as before), so
+    # only that prefix, and only the resources v touches, is re-checked. A full
+    # safety check runs only when the old order no longer works. A release never
+    # breaks the current sequence, so it needs no check at all.
+
+    def __init__(self, Max, Allocation, Available, latency_window=10000):
+        self.Max = [list(row) for row in Max]
+        self.Allocation = [list(row) for row in Allocation]
+        self.Available = list(Available)
+        is_safe, safe_sequence, self.Need = bankers_algorithm(self.Max, self.Allocation, self.Available)
+        if not is_safe:
+            raise ValueError("initial state is unsafe")
+        self._set_sequence(safe_sequence)
+        self.granted = 0
+        self.denied = 0
+        self.full_checks = 0
+        self.latencies = deque(maxlen=latency_window)
+
+    def _set_sequence(self, safe_sequence):
+        self.safe_sequence = safe_sequence
+        self.position = [0] * len(safe_sequence)
+        for k, i in enumerate(safe_sequence):
+            self.position[i] = k
+
+    def _check_vector(self, pid, vector, limit, what):
+        if not 0 <= pid < len(self.Need):
+            raise ValueError(f"unknown process P{pid}")
+        if len(vector) != len(self.Available):
+            raise ValueError(f"expected {len(self.Available)} resources, got {len(vector)}")
+        for j, v in enumerate(vector):
+            if v < 0:
+                raise ValueError("resource amounts must not be negative")
+            if v > limit[j]:
+                raise ValueError(f"P{pid} {what}")
+
+    def _prefix_still_safe(self, pid, changed):
+        # Walk the processes ahead of pid in the old sequence, tracking Work only
+        # for the resources the grant touched
+        Work = {j: self.Available[j] for j in changed}
+        for k in self.safe_sequence[:self.position[pid]]:
+            need, alloc = self.Need[k], self.Allocation[k]
+            for j in changed:
+                if need[j] > Work[j]:
+                    return False
+            for j in changed:
+                Work[j] += alloc[j]
+        return True
+
+    def _apply(self, pid, vector, sign):
+        alloc, need = self.Allocation[pid], self.Need[pid]
+        for j, v in enumerate(vector):
+            if v:
+                alloc[j] += sign * v
+                need[j] -= sign * v
+                self.Available[j] -= sign * v
+
+    def _decide(self, pid, vector):
+        self._check_vector(pid, vector, self.Need[pid], "has exceeded its maximum claim")
+        if any(v > a for v, a in zip(vector, self.Available)):
+            return False  # not enough free right now, P_i has to wait
+
+        # Tentatively grant, then keep it only if the state stays safe
+        self._apply(pid, vector, 1)
+        changed = [j for j, v in enumerate(vector) if v]
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("prefix_checks")
+        if self._prefix_still_safe(pid, changed):
+            return True
+
+        self.full_checks += 1
+        is_safe, safe_sequence = is_safe_state(self.Available, self.Allocation, self.Need)
+        if is_safe:
+            self._set_sequence(safe_sequence)
+            return True
+        self._apply(pid, vector, -1)
+        return False
+
+    def request(self, pid, vector):
+        # True if P_pid's request was granted, False if it has to wait
+        start = time.perf_counter()
+        try:
+            granted = self._decide(pid, vector)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+        if granted:
+            self.granted += 1
+        else:
+            self.denied += 1
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("requests")
+            Instrumentation.count("granted" if granted else "denied")
+        return granted
+
+    def release(self, pid, vector):
+        # P_pid hands resources back; the current safe sequence stays valid
+        self._check_vector(pid, vector, self.Allocation[pid], "is releasing more than it holds")
+        self._apply(pid, vector, -1)
+
+    def latency_stats(self):
+        # Decision latency (seconds) over the most recent requests
+        samples = sorted(self.latencies) or [0.0]
+        return {
+            "count": len(self.latencies),
+            "mean": sum(samples) / len(samples),
+            "p50": samples[(len(samples) - 1) // 2],
+            "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+            "max": samples[-1],
+            "granted": self.granted,
+            "denied": self.denied,
+            "full_checks": self.full_checks,
+        }
+
+
 def run_bankers_algorithm():
     print("\n--- Banker's Algorithm ---")
 
@@ -56,13 +257,11 @@ def run_bankers_algorithm():
             print("Error: Please enter only integers separated by spaces.")
 
         # NEED MATRIX CALCULATION
-    Need = []
-    for i in range(num_processes):
-        process_need = []
-        for j in range(num_resources):
-            # Need = Max - Allocation
-            process_need.append(Max[i][j] - Allocation[i][j])
-        Need.append(process_need)
+    try:
+        is_safe, safe_sequence, Need = bankers_algorithm(Max, Allocation, Available)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
 
     print("1.Calculate Need Matrix")
     for row in Need:
@@ -81,46 +280,12 @@ def run_bankers_algorithm():
     print("2.Calculate Total Resources")
     print(total_resources)
 
-    #SAFETY ALGORITHM
-
-    # Initialization
-    Work = list(Available)  # Work starts as a copy of Available
-    Finish = [False] * num_processes  # All processes start as unfinished
-    safe_sequence = []
-    count = 0
-
-    # Loop until all processes have finished or no safe process can be found
-    while count < num_processes:
-        found = False  # Flag to track if we found ANY process in this pass
-
-        # Search for a process i that can run
-        for i in range(num_processes):
-            # Check two conditions: 1. Not finished AND 2. Need can be met by Work
-            if (Finish[i] == False) and is_need_met(i, Need, Work):
-                # Process P_i is safe to run!
-                found = True
-
-                # Update Work: Add back resources P_i was holding (Allocation)
-                for j in range(num_resources):
-                    Work[j] += Allocation[i][j]
-
-                # Mark -> finished and record the sequence
-                Finish[i] = True
-                safe_sequence.append(f"P{i}")
-                count += 1
-                # We restart the search (break the inner loop) since Work has changed
-                break
-
-                # If we made a full pass and didn't find a single process to run, it's unsafe.
-        if found == False:
-            break
-
             # --- Results ---
     print("3. System state determination")
 
-    if count == num_processes:
+    if is_safe:
         print("The system is in a SAFE STATE.")
-        print(f"A Safe Sequence is: {safe_sequence}")
+        print(f"A Safe Sequence is: {[f'P{i}' for i in safe_sequence]}")
     else:
         print("The system is in an UNSAFE STATE.")
         print("No safe sequence could be found.")
@@ -128,7 +293,8 @@ def run_bankers_algorithm():
 
 
 # Execute the main function
-run_bankers_algorithm()
+if __name__ == "__main__":
+    run_bankers_algorithm()
 
 
 
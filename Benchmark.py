@@ -0,0 +1,169 @@
+# Benchmark harness for the scheduling, allocation, paging and Banker's modules.
+# Every benchmark runs at each requested input size and records wall time,
+# peak memory and ops/sec to JSON, optionally checking against a baseline:
+#
+#   python Benchmark.py --sizes 10 100 1000 10000 --output bench.json
+#   python Benchmark.py --baseline benchmark_baseline.json --threshold 0.25
+#
+# benchmark_baseline.json holds a reference run with the default sizes; the
+# machine and Python version it was recorded on are stored alongside. Timings
+# only compare meaningfully on similar hardware, so re-record it with --output
+# when the reference machine changes.
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from SchedulingAlgorithms.Scheduling import fcfs, sjf, srtf, priority_scheduling
+from ContiguousMemoryAllocation import best_fit, first_fit, worst_fit
+from Pagging import logicalToPhysical, pageMapTable, pageSize
+from BankersAlgorithm import is_safe_state
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+# --- Input builders: each returns a zero-argument callable running one pass ---
+
+def scheduling_case(fn):
+    def build(n, rng):
+        processes = [{"PID": i, "ArrivalTime": rng.randint(0, n), "BurstTime": rng.randint(1, 20),
+                      "Priority": rng.randint(1, 5)} for i in range(1, n + 1)]
+        return lambda: fn(processes)
+    return build
+
+
+def allocation_case(fn):
+    def build(n, rng):
+        blocks = [rng.randint(100, 1000) for _ in range(n)]
+        processes = [rng.randint(50, 1000) for _ in range(n)]
+        # The allocators shrink the blocks they are given, so each pass gets a copy
+        return lambda: fn(blocks.copy(), processes)
+    return build
+
+
+def paging_case(n, rng):
+    limit = len(pageMapTable) * pageSize
+    addresses = [rng.randrange(limit) for _ in range(n)]
+    return lambda: [logicalToPhysical(a) for a in addresses]
+
+
+def bankers_case(n, rng, resources=8):
+    # Tight but safe: the processes finish as a chain from P(n-1) down to P0.
+    # Each one needs more of every resource than is free until its
+    # predecessor in the chain has released its allocation, and no more than
+    # is free afterwards, so exactly one process is ever ready, and it is the
+    # last one a scan starting at P0 would look at: the classic check's worst case.
+    available = [rng.randint(0, 5) for _ in range(resources)]
+    allocation, need = [None] * n, [None] * n
+    work, previous = list(available), None
+    for i in range(n - 1, -1, -1):
+        if previous is None:
+            need[i] = [rng.randint(0, w) for w in work]
+        else:
+            need[i] = [rng.randint(p + 1, w) for p, w in zip(previous, work)]
+        allocation[i] = [rng.randint(1, 5) for _ in range(resources)]
+        previous, work = work, [w + a for w, a in zip(work, allocation[i])]
+    return lambda: is_safe_state(available, allocation, need)
+
+
+BENCHMARKS = {
+    "fcfs": scheduling_case(fcfs),
+    "sjf": scheduling_case(sjf),
+    "srtf": scheduling_case(srtf),
+    "priority_scheduling": scheduling_case(priority_scheduling),
+    "best_fit": allocation_case(best_fit),
+    "first_fit": allocation_case(first_fit),
+    "worst_fit": allocation_case(worst_fit),
+    "logicalToPhysical": paging_case,
+    "bankers_safety": bankers_case,
+}
+
+
+def measure(build, n, repeat, seed):
+    """Best-of-`repeat` wall time plus peak traced memory of one extra pass."""
+    rng = random.Random(seed)
+    run = build(n, rng)
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    # Memory is measured separately since tracing slows the timed passes down
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "size": n,
+        "wall_time": best,
+        "peak_memory": peak,
+        "ops_per_sec": n / best if best > 0 else float("inf"),
+    }
+
+
+def run_benchmarks(names, sizes, repeat=3, seed=0, budget=None):
+    """Runs each benchmark over the sizes; a benchmark skips its larger sizes
+    once a single pass takes longer than `budget` seconds."""
+    results = []
+    for name in names:
+        for n in sizes:
+            record = {"name": name}
+            record.update(measure(BENCHMARKS[name], n, repeat, seed))
+            results.append(record)
+            print(f"{name:<20} n={n:<9} {record['wall_time']:.6f}s "
+                  f"{record['peak_memory'] / 1024:.1f}KiB {record['ops_per_sec']:.0f} ops/s")
+            if budget is not None and record["wall_time"] > budget:
+                print(f"{name:<20} skipping sizes above {n} (over {budget}s budget)")
+                break
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    """Returns (name, size, old, new) for every case slower than baseline by more than threshold."""
+    previous = {(r["name"], r["size"]): r["wall_time"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = previous.get((r["name"], r["size"]))
+        if old is not None and r["wall_time"] > old * (1 + threshold):
+            regressions.append((r["name"], r["size"], old, r["wall_time"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the OS simulators.")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="input sizes, e.g. 10 100 1000000")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per case; the best is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=None, help="stop growing a benchmark past this many seconds")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging, as a fraction")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only or list(BENCHMARKS), args.sizes, args.repeat, args.seed, args.budget)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        for name, n, old, new in regressions:
+            print(f"REGRESSION {name} n={n}: {old:.6f}s -> {new:.6f}s ({new / old:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,43 +4,173 @@
                         # Process Sizes: [212, 417, 112, 426]
 
 
+import bisect
+import heapq
+import time
+
+import Instrumentation
+
+
+# Reports one fit call to the active profiler. None of the fits scans the
+# block list any more, so their "scans" are search-structure steps: a fixed
+# number per request (per_request) plus a fixed number per successful
+# placement (per_placement). Both follow from the allocation vector, so the
+# fit loops themselves carry no counters.
+def _count_fits(allocation, blocks, per_request, per_placement):
+    placed = len(allocation) - allocation.count(-1)
+    Instrumentation.count("blocks", len(blocks))
+    Instrumentation.count("requests", len(allocation))
+    Instrumentation.count("unallocated", len(allocation) - placed)
+    for name, n in per_request.items():
+        Instrumentation.count(name, n * len(allocation))
+    for name, n in per_placement.items():
+        Instrumentation.count(name, n * placed)
+
+
+# Max segment tree over block sizes. The leftmost block that fits a request is
+# found in O(log m) by descending into the left child whenever its max fits.
+class _MaxSegmentTree:
+    def __init__(self, values):
+        size = 1
+        while size < len(values):
+            size *= 2
+        self.size = size
+        # Padding leaves can never fit anything
+        self.tree = [float('-inf')] * (2 * size)
+        self.tree[size:size + len(values)] = values
+        for i in range(size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def first_at_least(self, value):
+        tree = self.tree
+        if tree[1] < value:
+            return -1
+        i = 1
+        while i < self.size:
+            i = 2 * i if tree[2 * i] >= value else 2 * i + 1
+        return i - self.size
+
+    def update(self, index, value):
+        tree = self.tree
+        i = index + self.size
+        tree[i] = value
+        i //= 2
+        while i:
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+            i //= 2
+
+
+# Sorted multiset split into short buckets, so an insert or removal only shifts
+# one bucket instead of the whole list. `maxes` holds each bucket's last item
+# and is bisected first to pick the bucket.
+class _SortedBuckets:
+    def __init__(self, items, load=512):
+        items = sorted(items)
+        self.load = load
+        self.buckets = [items[k:k + load] for k in range(0, len(items), load)]
+        self.maxes = [bucket[-1] for bucket in self.buckets]
+
+    def pop_at_least(self, key):
+        # Remove and return the smallest item >= key, or None
+        k = bisect.bisect_left(self.maxes, key)
+        if k == len(self.maxes):
+            return None
+        bucket = self.buckets[k]
+        item = bucket.pop(bisect.bisect_left(bucket, key))
+        if not bucket:
+            del self.buckets[k]
+            del self.maxes[k]
+        else:
+            self.maxes[k] = bucket[-1]
+        return item
+
+    def at_least(self, key):
+        # Smallest item >= key without removing it, or None
+        k = bisect.bisect_left(self.maxes, key)
+        if k == len(self.maxes):
+            return None
+        bucket = self.buckets[k]
+        return bucket[bisect.bisect_left(bucket, key)]
+
+    def remove(self, item):
+        k = bisect.bisect_left(self.maxes, item)
+        bucket = self.buckets[k]
+        del bucket[bisect.bisect_left(bucket, item)]
+        if not bucket:
+            del self.buckets[k]
+            del self.maxes[k]
+        else:
+            self.maxes[k] = bucket[-1]
+
+    def max(self):
+        return self.maxes[-1] if self.maxes else None
+
+    def add(self, item):
+        if not self.maxes:
+            self.buckets.append([item])
+            self.maxes.append(item)
+            return
+        k = min(bisect.bisect_left(self.maxes, item), len(self.maxes) - 1)
+        bucket = self.buckets[k]
+        bisect.insort(bucket, item)
+        self.maxes[k] = bucket[-1]
+        if len(bucket) > 2 * self.load:
+            self.buckets.insert(k + 1, bucket[self.load:])
+            del bucket[self.load:]
+            self.maxes.insert(k, bucket[-1])
+
+
 #BEST FIT ALGORITHM
+# Blocks are kept sorted by (size, index), so the smallest block that fits (and
+# the lowest index among equal sizes, like the old scan) is found by bisection.
 def best_fit(blocks, processes):
     allocation = [-1] * len(processes)
+    free = _SortedBuckets((block_size, j) for j, block_size in enumerate(blocks))
     for i, processes_size in enumerate(processes):
-        best_index = -1
-        for j, block_size in enumerate(blocks):
-            if block_size >= processes_size:
-                if best_index == -1 or blocks[j] < blocks[best_index]:
-                    best_index = j
-        if best_index != -1:
+        best = free.pop_at_least((processes_size, -1))
+        if best is not None:
+            best_index = best[1]
             allocation[i] = best_index
             blocks[best_index] -= processes_size
+            free.add((blocks[best_index], best_index))
+    if Instrumentation.profiler is not None:
+        # One bisection over the bucket maxima, one inside the bucket on a hit
+        _count_fits(allocation, blocks, {"bisections": 1}, {"bisections": 1, "bucket_inserts": 1})
     return allocation
 
 #FIRST FIT ALGORITHM
 def first_fit(blocks ,processes):
     allocation =[-1] * len(processes)
+    tree = _MaxSegmentTree(blocks)
     for i , processes_size in enumerate(processes):
-        for j , block_size in enumerate(blocks):
-            if block_size >= processes_size:
-                allocation[i] = j
-                blocks[j] -= processes_size
-                break
+        j = tree.first_at_least(processes_size)
+        if j != -1:
+            allocation[i] = j
+            blocks[j] -= processes_size
+            tree.update(j, blocks[j])
+    if Instrumentation.profiler is not None:
+        # The root check, then one node per level down to the leaf on a hit;
+        # the update rewrites the leaf and every ancestor
+        depth = tree.size.bit_length() - 1
+        _count_fits(allocation, blocks, {"tree_nodes_visited": 1},
+                    {"tree_nodes_visited": depth, "tree_nodes_updated": depth + 1})
     return allocation
 
 #WORST FIT ALGORITHM
+# Max-heap of (-size, index): the top is the largest block, lowest index first.
+# Each block has exactly one entry, replaced in place after every allocation.
 def worst_fit(blocks, processes):
     allocation = [-1] * len(processes)
+    largest = [(-block_size, j) for j, block_size in enumerate(blocks)]
+    heapq.heapify(largest)
     for i, processes_size in enumerate(processes):
-        worst_index = -1
-        for j, block_size in enumerate(blocks):
-            if block_size >= processes_size:
-                if worst_index == -1 or blocks[j] > blocks[worst_index]:
-                    worst_index = j
-        if worst_index != -1:
+        if largest and -largest[0][0] >= processes_size:
+            worst_index = largest[0][1]
             allocation[i] = worst_index
             blocks[worst_index] -= processes_size
+            heapq.heapreplace(largest, (-blocks[worst_index], worst_index))
+    if Instrumentation.profiler is not None:
+        _count_fits(allocation, blocks, {"heap_top_checks": 1}, {"heap_replaces": 1})
     return allocation
 
 def print_allocation(processes , allocation,blocks):
@@ -50,17 +180,499 @@ def print_allocation(processes , allocation,blocks):
         else:
             print(f"Process {i+1} of size {processes[i]}KB not allocated")
 
-memory_blocks = [100, 500, 200, 300, 600]
-process_sizes = [212, 417, 112, 426]
 
-# Best Fit Allocation
-print("Best Fit Allocation:")
-print_allocation(process_sizes , best_fit(memory_blocks.copy(), process_sizes),memory_blocks)
+FIT_ALGORITHMS = {"best_fit": best_fit, "first_fit": first_fit, "worst_fit": worst_fit}
+
+
+def compare_fits(blocks, processes, names=None, cache=None):
+    # Runs each fit on its own copy of blocks; returns {name: (allocation,
+    # remaining block sizes)}. With a cache (e.g. ResultsCache.ResultsCache)
+    # fits it already holds for these blocks and processes are not rerun.
+    digest = cache.digest((blocks, processes)) if cache is not None else None
+    results = {}
+    for name in names or FIT_ALGORITHMS:
+        key = result = None
+        if cache is not None:
+            key = cache.key(name, digest, FIT_ALGORITHMS[name])
+            result = cache.get(key)
+        if result is None:
+            remaining = list(blocks)
+            result = (FIT_ALGORITHMS[name](remaining, processes), remaining)
+            if cache is not None:
+                cache.put(key, result)
+        results[name] = result
+    return results
+
+# Free holes in address order, bucketed like _SortedBuckets. Each bucket also
+# remembers its largest hole so first fit can skip whole buckets that are too small.
+class _HoleList:
+    def __init__(self, load=256):
+        self.load = load
+        self.starts = []  # per bucket: sorted hole start addresses
+        self.sizes = []   # per bucket: the matching hole sizes
+        self.firsts = []  # first start address of every bucket
+        self.bigs = []    # largest hole of every bucket
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.starts)
+
+    def __iter__(self):
+        for starts, sizes in zip(self.starts, self.sizes):
+            yield from zip(starts, sizes)
+
+    def _bucket(self, start):
+        return max(0, bisect.bisect_right(self.firsts, start) - 1)
+
+    def add(self, start, size):
+        if not self.starts:
+            self.starts.append([start])
+            self.sizes.append([size])
+            self.firsts.append(start)
+            self.bigs.append(size)
+            return
+        k = self._bucket(start)
+        starts, sizes = self.starts[k], self.sizes[k]
+        pos = bisect.bisect_left(starts, start)
+        starts.insert(pos, start)
+        sizes.insert(pos, size)
+        self.firsts[k] = starts[0]
+        self.bigs[k] = max(self.bigs[k], size)
+        if len(starts) > 2 * self.load:
+            self.starts.insert(k + 1, starts[self.load:])
+            self.sizes.insert(k + 1, sizes[self.load:])
+            del starts[self.load:], sizes[self.load:]
+            self.firsts.insert(k + 1, self.starts[k + 1][0])
+            self.bigs[k] = max(sizes)
+            self.bigs.insert(k + 1, max(self.sizes[k + 1]))
+
+    def remove(self, start):
+        k = self._bucket(start)
+        starts, sizes = self.starts[k], self.sizes[k]
+        pos = bisect.bisect_left(starts, start)
+        del starts[pos]
+        size = sizes.pop(pos)
+        if not starts:
+            del self.starts[k], self.sizes[k], self.firsts[k], self.bigs[k]
+            return
+        self.firsts[k] = starts[0]
+        if size == self.bigs[k]:
+            self.bigs[k] = max(sizes)
+
+    def before(self, address):
+        # Hole with the largest start below address, as (start, size) or None
+        k = bisect.bisect_left(self.firsts, address) - 1
+        if k < 0:
+            return None
+        pos = bisect.bisect_left(self.starts[k], address) - 1
+        return self.starts[k][pos], self.sizes[k][pos]
+
+    def at_or_after(self, address):
+        # Hole with the smallest start >= address, as (start, size) or None
+        k = self._bucket(address)
+        while k < len(self.starts):
+            pos = bisect.bisect_left(self.starts[k], address)
+            if pos < len(self.starts[k]):
+                return self.starts[k][pos], self.sizes[k][pos]
+            k += 1
+        return None
+
+    def next_fit(self, size, address):
+        # First hole that fits starting at address or later, wrapping to the start
+        k = self._bucket(address)
+        pos = bisect.bisect_left(self.starts[k], address) if self.starts else 0
+        while k < len(self.starts):
+            if self.bigs[k] >= size:
+                starts, sizes = self.starts[k], self.sizes[k]
+                for p in range(pos, len(starts)):
+                    if sizes[p] >= size:
+                        return starts[p], sizes[p]
+            k, pos = k + 1, 0
+        return self.first_fit(size)
+
+    def first_fit(self, size):
+        for k, big in enumerate(self.bigs):
+            if big >= size:
+                for start, hole in zip(self.starts[k], self.sizes[k]):
+                    if hole >= size:
+                        return start, hole
+        return None
+
+
+# Common interface for the dynamic allocators: allocate(pid, size) returns the
+# start address given to pid or -1, free(pid) gives it back. Subclasses
+# implement _place/_release and report their free space, so every strategy gets
+# the same utilisation/fragmentation figures and trace replay.
+class Allocator:
+    name = "allocator"
+
+    def __init__(self, size):
+        self.size = size
+        self.allocations = {}  # pid -> (start, reserved size)
+        self.requested = {}    # pid -> size it asked for
+        self.used = 0          # memory requested by live processes
+        self.reserved = 0      # memory actually set aside, including rounding
+        self.failed = 0
+
+    def _place(self, size):
+        # Returns (start, reserved size) or None
+        raise NotImplementedError
+
+    def _release(self, start, reserved):
+        raise NotImplementedError
+
+    def largest_hole(self):
+        raise NotImplementedError
+
+    def hole_count(self):
+        raise NotImplementedError
+
+    def allocate(self, pid, size):
+        if pid in self.allocations:
+            raise ValueError(f"process {pid} already holds memory")
+        placed = self._place(size)
+        if placed is None:
+            self.failed += 1
+            return -1
+        self.allocations[pid] = placed
+        self.used += size
+        self.reserved += placed[1]
+        self.requested[pid] = size
+        return placed[0]
+
+    def free(self, pid):
+        start, reserved = self.allocations.pop(pid)
+        self.used -= self.requested.pop(pid)
+        self.reserved -= reserved
+        self._release(start, reserved)
+
+    def utilisation(self):
+        return self.used / self.size if self.size else 0.0
+
+    def fragmentation(self):
+        # External fragmentation: share of free memory outside the largest hole
+        free = self.size - self.reserved
+        return 1 - self.largest_hole() / free if free else 0.0
+
+    def internal_fragmentation(self):
+        # Share of reserved memory lost to rounding requests up
+        return 1 - self.used / self.reserved if self.reserved else 0.0
+
+    def stats(self):
+        return {
+            "utilisation": self.utilisation(),
+            "fragmentation": self.fragmentation(),
+            "internal_fragmentation": self.internal_fragmentation(),
+            "holes": self.hole_count(),
+            "largest_hole": self.largest_hole(),
+            "failed": self.failed,
+        }
+
+    def replay(self, events, sample_every=1000):
+        # Replays ("alloc", pid, size) / ("free", pid) events and samples stats
+        # every sample_every events; returns the list of samples. Frees of
+        # processes whose allocation failed are ignored.
+        samples = []
+        n = allocs = 0
+        failed = self.failed
+        with Instrumentation.phase("replay"):
+            for n, event in enumerate(events, 1):
+                if event[0] == "alloc":
+                    self.allocate(event[1], event[2])
+                    allocs += 1
+                elif event[0] == "free":
+                    if event[1] in self.allocations:
+                        self.free(event[1])
+                else:
+                    raise ValueError(f"unknown event {event[0]!r}")
+                if n % sample_every == 0:
+                    sample = {"event": n}
+                    sample.update(self.stats())
+                    samples.append(sample)
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("events", n)
+            Instrumentation.count("allocs", allocs)
+            Instrumentation.count("failed_allocs", self.failed - failed)
+            Instrumentation.count("samples", len(samples))
+        return samples
+
+
+# Dynamic contiguous memory: processes allocate and free over time, freed
+# memory is coalesced with neighbouring holes, and fragmentation can be cured by
+# compaction, either on demand (a request fails although enough memory is free)
+# or whenever external fragmentation rises above compaction_threshold.
+class MemoryManager(Allocator):
+    FITS = ("first", "next", "best", "worst")
+
+    def __init__(self, size, fit="first", compact_on_demand=False, compaction_threshold=None):
+        if fit not in self.FITS:
+            raise ValueError(f"fit must be one of {self.FITS}, got {fit!r}")
+        super().__init__(size)
+        self.name = f"{fit}_fit"
+        self.fit = fit
+        self.compact_on_demand = compact_on_demand
+        self.compaction_threshold = compaction_threshold
+        self.holes = _HoleList()
+        self.by_size = _SortedBuckets([])  # (size, start) of every hole
+        self.rover = 0  # where next fit resumes searching
+        self.compactions = 0
+        self.moved = 0  # memory copied by compaction
+        if size > 0:
+            self._add_hole(0, size)
+
+    def _add_hole(self, start, size):
+        self.holes.add(start, size)
+        self.by_size.add((size, start))
+
+    def _remove_hole(self, start, size):
+        self.holes.remove(start)
+        self.by_size.remove((size, start))
+
+    def _find_hole(self, size):
+        if self.fit == "first":
+            return self.holes.first_fit(size)
+        if self.fit == "next":
+            return self.holes.next_fit(size, self.rover)
+        if self.fit == "best":
+            hole = self.by_size.at_least((size, -1))
+        else:
+            largest = self.by_size.max()
+            if largest is None or largest[0] < size:
+                return None
+            # Largest hole, lowest address among equal sizes
+            hole = self.by_size.at_least((largest[0], -1))
+        return None if hole is None else (hole[1], hole[0])
+
+    def _place(self, size):
+        hole = self._find_hole(size)
+        if hole is None and self.compact_on_demand and self.size - self.used >= size:
+            self.compact()
+            hole = self._find_hole(size)
+        if hole is None:
+            return None
+
+        start, hole_size = hole
+        self._remove_hole(start, hole_size)
+        if hole_size > size:
+            self._add_hole(start + size, hole_size - size)
+        self.rover = start + size
+        return start, size
+
+    def free(self, pid):
+        super().free(pid)
+        if self.compaction_threshold is not None and self.fragmentation() > self.compaction_threshold:
+            self.compact()
+
+    def _release(self, start, size):
+        # Merge the freed block with the holes on either side
+        prev = self.holes.before(start)
+        if prev is not None and prev[0] + prev[1] == start:
+            self._remove_hole(*prev)
+            start, size = prev[0], prev[1] + size
+        nxt = self.holes.at_or_after(start + size)
+        if nxt is not None and nxt[0] == start + size:
+            self._remove_hole(*nxt)
+            size += nxt[1]
+        self._add_hole(start, size)
+
+    def compact(self):
+        # Slide every allocation down to the lowest addresses, leaving one hole
+        address = 0
+        for pid, (start, size) in sorted(self.allocations.items(), key=lambda item: item[1][0]):
+            if start != address:
+                self.allocations[pid] = (address, size)
+                self.moved += size
+            address += size
+        self.holes = _HoleList()
+        self.by_size = _SortedBuckets([])
+        if address < self.size:
+            self._add_hole(address, self.size - address)
+        self.rover = address
+        self.compactions += 1
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("compactions")
+            Instrumentation.count("compacted_processes", len(self.allocations))
+
+    def largest_hole(self):
+        largest = self.by_size.max()
+        return largest[0] if largest else 0
+
+    def hole_count(self):
+        return len(self.holes)
+
+    def stats(self):
+        stats = super().stats()
+        stats["compactions"] = self.compactions
+        stats["moved"] = self.moved
+        return stats
+
+
+# Binary buddy allocator: every request is rounded up to a power of two and
+# taken from the free list of that order, splitting a larger block if needed.
+# On free a block merges with its buddy (address XOR size) while the buddy is
+# free too. A size that is not a power of two starts out as several aligned
+# top-level blocks.
+class BuddyAllocator(Allocator):
+    name = "buddy"
+
+    def __init__(self, size, min_order=0):
+        super().__init__(size)
+        self.min_order = min_order
+        self.max_order = max(size.bit_length() - 1, min_order)
+        # Per order: set of free block addresses, plus a heap of the same
+        # addresses (lazily cleaned) so the lowest address is handed out first
+        self.free_sets = [set() for _ in range(self.max_order + 1)]
+        self.free_heaps = [[] for _ in range(self.max_order + 1)]
+        address = 0
+        for order in range(self.max_order, min_order - 1, -1):
+            if size - address >= 1 << order:
+                self._push(order, address)
+                address += 1 << order
+
+    def _push(self, order, address):
+        self.free_sets[order].add(address)
+        heapq.heappush(self.free_heaps[order], address)
+
+    def _pop(self, order):
+        heap, free = self.free_heaps[order], self.free_sets[order]
+        while heap:
+            address = heapq.heappop(heap)
+            if address in free:
+                free.remove(address)
+                return address
+        return None
+
+    def _order(self, size):
+        return max(self.min_order, (max(size, 1) - 1).bit_length())
+
+    def _place(self, size):
+        want = self._order(size)
+        for order in range(want, self.max_order + 1):
+            if self.free_sets[order]:
+                address = self._pop(order)
+                # Split down, keeping the upper halves free
+                while order > want:
+                    order -= 1
+                    self._push(order, address + (1 << order))
+                return address, 1 << want
+        return None
+
+    def _release(self, address, reserved):
+        order = reserved.bit_length() - 1
+        while order < self.max_order:
+            buddy = address ^ (1 << order)
+            if buddy not in self.free_sets[order]:
+                break
+            self.free_sets[order].remove(buddy)
+            address = min(address, buddy)
+            order += 1
+        self._push(order, address)
+
+    def largest_hole(self):
+        for order in range(self.max_order, self.min_order - 1, -1):
+            if self.free_sets[order]:
+                return 1 << order
+        return 0
+
+    def hole_count(self):
+        return sum(len(free) for free in self.free_sets)
+
+
+# Segregated free lists: requests are rounded up to a power-of-two size class,
+# each class keeps a stack of freed slots, and new slots are carved off the
+# untouched end of memory. Allocation and free are O(1) in the number of slots;
+# freed memory is never merged, so it stays tied to its size class.
+class SegregatedListAllocator(Allocator):
+    name = "segregated"
+
+    def __init__(self, size, min_class=16):
+        super().__init__(size)
+        self.min_order = (min_class - 1).bit_length()
+        self.free_lists = {}  # order -> stack of free slot addresses
+        self.top = 0          # start of the never-used tail of memory
+
+    def _place(self, size):
+        want = max(self.min_order, (max(size, 1) - 1).bit_length())
+        slots = self.free_lists.get(want)
+        if slots:
+            return slots.pop(), 1 << want
+        if self.top + (1 << want) <= self.size:
+            address = self.top
+            self.top += 1 << want
+            return address, 1 << want
+        # No fresh memory left: fall back to a free slot of a larger class
+        for order in sorted(self.free_lists):
+            if order > want and self.free_lists[order]:
+                return self.free_lists[order].pop(), 1 << order
+        return None
+
+    def _release(self, address, reserved):
+        self.free_lists.setdefault(reserved.bit_length() - 1, []).append(address)
+
+    def largest_hole(self):
+        largest = self.size - self.top
+        for order, slots in self.free_lists.items():
+            if slots:
+                largest = max(largest, 1 << order)
+        return largest
+
+    def hole_count(self):
+        return sum(len(slots) for slots in self.free_lists.values()) + (self.top < self.size)
+
+
+# Strategies compare_allocators can build by name, each taking the memory size
+ALLOCATORS = {
+    "first_fit": lambda size: MemoryManager(size, "first"),
+    "next_fit": lambda size: MemoryManager(size, "next"),
+    "best_fit": lambda size: MemoryManager(size, "best"),
+    "worst_fit": lambda size: MemoryManager(size, "worst"),
+    "buddy": BuddyAllocator,
+    "segregated": SegregatedListAllocator,
+}
+
+
+def compare_allocators(events, size, names=None, sample_every=1000, cache=None):
+    # Replays the same event list on each strategy; returns one row per strategy
+    # with its throughput, mean sampled fragmentation and final stats. With a
+    # cache, strategies it already holds a row for are not replayed (their
+    # events_per_sec is the one measured when the row was stored).
+    events = list(events)
+    digest = cache.digest(events) if cache is not None else None
+    rows = []
+    for name in names or ALLOCATORS:
+        key = None
+        if cache is not None:
+            key = cache.key(name, digest, ALLOCATORS[name], size=size, sample_every=sample_every)
+            row = cache.get(key)
+            if row is not None:
+                rows.append(row)
+                continue
+        allocator = ALLOCATORS[name](size)
+        with Instrumentation.phase(name):
+            start = time.perf_counter()
+            samples = allocator.replay(events, sample_every)
+            elapsed = time.perf_counter() - start
+        row = {"allocator": name, "events_per_sec": len(events) / elapsed if elapsed > 0 else float("inf")}
+        row["mean_fragmentation"] = (sum(sample["fragmentation"] for sample in samples) / len(samples)
+                                     if samples else allocator.fragmentation())
+        row.update(allocator.stats())
+        if cache is not None:
+            cache.put(key, row)
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    memory_blocks = [100, 500, 200, 300, 600]
+    process_sizes = [212, 417, 112, 426]
+
+    # Best Fit Allocation
+    print("Best Fit Allocation:")
+    print_allocation(process_sizes , best_fit(memory_blocks.copy(), process_sizes),memory_blocks)
 
-# First Fit Allocation
-print("\nFirst Fit Allocation:")
-print_allocation(process_sizes , first_fit(memory_blocks.copy(), process_sizes),memory_blocks)
+    # First Fit Allocation
+    print("\nFirst Fit Allocation:")
+    print_allocation(process_sizes , first_fit(memory_blocks.copy(), process_sizes),memory_blocks)
 
-# Worst Fit Allocation
-print("\nWorst Fit Allocation:")
-print_allocation(process_sizes , worst_fit(memory_blocks.copy(), process_sizes),memory_blocks)
+    # Worst Fit Allocation
+    print("\nWorst Fit Allocation:")
+    print_allocation(process_sizes , worst_fit(memory_blocks.copy(), process_sizes),memory_blocks)
@@ -0,0 +1,111 @@
+# Opt-in instrumentation for the simulators.
+#
+# This module is the single switch for every instrumented module: `profiler`
+# holds the active profiler, None by default. The hooks sit at function
+# boundaries and report counts the function already knows (heap operations,
+# scans, preemptions, lookups, safety-loop passes, ...); event loops keep
+# local tallies and report them once per call. With no profiler set the only
+# cost is one `is not None` check per call. Anything with count() and phase()
+# works as a profiler; Profiler below also times the phases and exports them:
+#
+#   profiler = Profiler()
+#   set_profiler(profiler)
+#   with profiler.phase("srtf"):
+#       srtf(table)
+#   profiler.write_json("profile.json")
+#   profiler.write_folded("profile.folded")   # flamegraph.pl / speedscope input
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+profiler = None
+
+
+def set_profiler(new):
+    """Makes new the active profiler (None switches instrumentation off) and
+    returns the previous one, so callers can restore it."""
+    global profiler
+    previous, profiler = profiler, new
+    return previous
+
+
+def phase(name):
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+def count(name, n=1):
+    if profiler is not None:
+        profiler.count(name, n)
+
+
+class Profiler:
+    def __init__(self):
+        self.stack = []
+        self.timings = {}   # phase stack (tuple) -> [calls, total seconds]
+        self.counters = {}  # phase stack (tuple) -> {counter: value}
+
+    @contextmanager
+    def phase(self, name):
+        self.stack.append(name)
+        key = tuple(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.timings.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+            self.stack.pop()
+
+    def count(self, name, n=1):
+        counters = self.counters.setdefault(tuple(self.stack), {})
+        counters[name] = counters.get(name, 0) + n
+
+    def reset(self):
+        self.stack.clear()
+        self.timings.clear()
+        self.counters.clear()
+
+    def _self_times(self):
+        # Total time of each phase minus the time spent in its direct children
+        child_time = {}
+        for key, (_, total) in self.timings.items():
+            if len(key) > 1:
+                child_time[key[:-1]] = child_time.get(key[:-1], 0.0) + total
+        return {key: max(total - child_time.get(key, 0.0), 0.0) for key, (_, total) in self.timings.items()}
+
+    def to_dict(self):
+        self_times = self._self_times()
+        return {
+            "phases": [{"stack": ";".join(key), "calls": calls, "total_time": total, "self_time": self_times[key]}
+                       for key, (calls, total) in sorted(self.timings.items())],
+            "counters": {";".join(key): dict(sorted(values.items()))
+                         for key, values in sorted(self.counters.items())},
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def folded(self):
+        """Folded stacks ("a;b;c <self microseconds>" per line), the input
+        format of flamegraph.pl, inferno and speedscope."""
+        return [f"{';'.join(key)} {round(t * 1e6)}" for key, t in sorted(self._self_times().items())]
+
+    def write_folded(self, path):
+        with open(path, "w") as f:
+            f.write("\n".join(self.folded()) + "\n")
+
+    def report(self):
+        """Human-readable table of phases and their counters."""
+        lines = [f"{'phase':<40} {'calls':>7} {'total s':>10}  counters"]
+        keys = sorted(set(self.timings) | set(self.counters))
+        for key in keys:
+            calls, total = self.timings.get(key, (0, 0.0))
+            counters = " ".join(f"{k}={v}" for k, v in sorted(self.counters.get(key, {}).items()))
+            name = "  " * (len(key) - 1) + (key[-1] if key else "(outside any phase)")
+            lines.append(f"{name:<40} {calls:>7} {total:>10.6f}  {counters}")
+        return "\n".join(lines)
+
@@ -0,0 +1,264 @@
+# Demand paging on top of Pagging.py: only `frames` pages can be resident, a
+# reference to any other page is a page fault, and a replacement policy picks
+# the victim once every frame is in use.
+#
+# Address traces are flat binary files of little-endian unsigned addresses
+# (4 or 8 bytes each), or address traces in the TraceFormat layout, which are
+# recognised by their header. Either way they are read through mmap, so a
+# multi-GB trace is streamed from the page cache instead of being loaded into memory.
+
+import heapq
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import Instrumentation
+from Pagging import pageOffset, pageSize
+from TraceFormat import MAGIC, parse_trace
+
+
+# --- Replacement policies ---
+# access(page) returns (fault, victim): fault is True on a page fault and
+# victim is the evicted page, or None while free frames are left.
+
+class FIFOReplacement:
+    def __init__(self, frames):
+        self.frames = frames
+        self.resident = OrderedDict()  # insertion order = load order
+
+    def access(self, page):
+        if page in self.resident:
+            return False, None
+        victim = None
+        if len(self.resident) >= self.frames:
+            victim = self.resident.popitem(last=False)[0]
+        self.resident[page] = None
+        return True, victim
+
+
+class LRUReplacement:
+    # OrderedDict as an O(1) recency list: a hit moves the page to the end
+    def __init__(self, frames):
+        self.frames = frames
+        self.resident = OrderedDict()
+
+    def access(self, page):
+        if page in self.resident:
+            self.resident.move_to_end(page)
+            return False, None
+        victim = None
+        if len(self.resident) >= self.frames:
+            victim = self.resident.popitem(last=False)[0]
+        self.resident[page] = None
+        return True, victim
+
+
+class ClockReplacement:
+    # Second chance: the hand skips (and clears) frames whose reference bit is set
+    def __init__(self, frames):
+        self.frames = frames
+        self.slots = []               # page held by each frame
+        self.referenced = bytearray(frames)
+        self.slotOf = {}              # page -> frame slot
+        self.hand = 0
+
+    def access(self, page):
+        slot = self.slotOf.get(page)
+        if slot is not None:
+            self.referenced[slot] = 1
+            return False, None
+        if len(self.slots) < self.frames:
+            self.slotOf[page] = len(self.slots)
+            self.referenced[len(self.slots)] = 1
+            self.slots.append(page)
+            return True, None
+        while self.referenced[self.hand]:
+            self.referenced[self.hand] = 0
+            self.hand = (self.hand + 1) % self.frames
+        victim = self.slots[self.hand]
+        del self.slotOf[victim]
+        self.slots[self.hand] = page
+        self.slotOf[page] = self.hand
+        self.referenced[self.hand] = 1
+        self.hand = (self.hand + 1) % self.frames
+        return True, victim
+
+
+class OPTReplacement:
+    # Belady's optimal policy: evict the page whose next use is furthest away.
+    # Needs the whole page sequence up front to precompute next-use positions
+    # (8 bytes per reference); accesses must then follow that same sequence.
+    def __init__(self, frames, pages):
+        self.frames = frames
+        never = len(pages)
+        self.nextUse = array('q', bytes(8 * len(pages)))
+        seen = {}
+        for i in range(len(pages) - 1, -1, -1):
+            page = pages[i]
+            self.nextUse[i] = seen.get(page, never)
+            seen[page] = i
+        self.position = 0
+        self.resident = {}  # page -> its next use
+        self.furthest = []  # max-heap of (-nextUse, page), stale entries skipped and compacted
+
+    def access(self, page):
+        nextUse = self.nextUse[self.position]
+        self.position += 1
+        fault, victim = page not in self.resident, None
+        if fault and len(self.resident) >= self.frames:
+            while True:
+                negUse, candidate = heapq.heappop(self.furthest)
+                if self.resident.get(candidate) == -negUse:
+                    break
+            del self.resident[candidate]
+            victim = candidate
+        self.resident[page] = nextUse
+        heapq.heappush(self.furthest, (-nextUse, page))
+        if len(self.furthest) > 2 * self.frames:
+            # Hits leave stale entries behind; drop them so the heap stays
+            # O(frames) instead of growing with the trace
+            self.furthest = [(-use, p) for p, use in self.resident.items()]
+            heapq.heapify(self.furthest)
+        return fault, victim
+
+
+POLICIES = {
+    "fifo": FIFOReplacement,
+    "lru": LRUReplacement,
+    "clock": ClockReplacement,
+    "opt": OPTReplacement,
+}
+
+
+def makePolicy(name, frames, pages=None):
+    if name not in POLICIES:
+        raise ValueError(f"unknown policy {name!r}, expected one of {sorted(POLICIES)}")
+    if name == "opt":
+        if pages is None:
+            raise ValueError("OPT needs the full page sequence in advance")
+        return OPTReplacement(frames, pages)
+    return POLICIES[name](frames)
+
+
+# Demand-paged translation: pages get a frame on first touch (a page fault),
+# and once memory is full the policy's victim gives up its frame.
+class DemandPager:
+    def __init__(self, frames, policy="lru", pages=None):
+        if frames <= 0:
+            raise ValueError("frames must be positive")
+        self.policy = makePolicy(policy, frames, pages)
+        self.pageTable = {}  # resident page -> frame
+        self.freeFrames = list(range(frames - 1, -1, -1))
+        self.references = 0
+        self.faults = 0
+
+    def access(self, logicalAddress):
+        pageNumber = logicalAddress >> pageOffset
+        offset = logicalAddress & (pageSize - 1)
+        self.references += 1
+        fault, victim = self.policy.access(pageNumber)
+        if fault:
+            self.faults += 1
+            frame = self.pageTable.pop(victim) if victim is not None else self.freeFrames.pop()
+            self.pageTable[pageNumber] = frame
+            if Instrumentation.profiler is not None:
+                Instrumentation.count("page_faults")
+                Instrumentation.count("evictions", victim is not None)
+        return (self.pageTable[pageNumber] * pageSize) + offset
+
+    def faultRate(self):
+        return self.faults / self.references if self.references else 0.0
+
+
+# --- Binary address traces ---
+
+def _typecode(addressSize):
+    for code in ("I", "Q") if addressSize == 4 else ("Q",) if addressSize == 8 else ():
+        if array(code).itemsize == addressSize:
+            return code
+    raise ValueError("addressSize must be 4 or 8")
+
+def writeTrace(path, addresses, addressSize=4):
+    # Writes addresses as little-endian unsigned integers
+    data = array(_typecode(addressSize), addresses)
+    if sys.byteorder != "little":
+        data.byteswap()
+    with open(path, "wb") as f:
+        data.tofile(f)
+
+@contextmanager
+def openTrace(path, addressSize=4):
+    # Yields the trace as a read-only memoryview of addresses backed by mmap.
+    # addressSize only applies to headerless traces.
+    code = _typecode(addressSize)
+    if sys.byteorder != "little":
+        raise NotImplementedError("zero-copy traces need a little-endian host")
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            yield memoryview(array(code))
+            return
+        with mapped:
+            if mapped[:len(MAGIC)] == MAGIC:
+                kind, columns = parse_trace(mapped)
+                if kind != "address":
+                    for column in columns.values():
+                        column.release()  # so the mapping can be closed
+                    raise ValueError(f"{path}: expected address trace, found {kind}")
+                view = columns.pop("address")
+            else:
+                usable = len(mapped) - len(mapped) % addressSize
+                view = memoryview(mapped)[:usable].cast(code)
+            try:
+                yield view
+            finally:
+                view.release()
+
+def tracePages(addresses):
+    return (address >> pageOffset for address in addresses)
+
+def simulateTrace(path, frames, policies=("fifo", "lru", "clock", "opt"), addressSize=4):
+    # Fault count and fault rate of each policy over one trace file
+    rows = []
+    with openTrace(path, addressSize) as addresses:
+        for name in policies:
+            with Instrumentation.phase(name):
+                pages = None
+                if name == "opt":
+                    # OPT indexes the sequence twice, so give it the page numbers
+                    with Instrumentation.phase("prepare"):
+                        pages = array('Q', tracePages(addresses))
+                policy = makePolicy(name, frames, pages)
+                access = policy.access
+                faults = 0
+                for page in (pages if pages is not None else tracePages(addresses)):
+                    faults += access(page)[0]
+                if Instrumentation.profiler is not None:
+                    Instrumentation.count("references", len(addresses))
+                    Instrumentation.count("page_faults", faults)
+            rows.append({
+                "policy": name,
+                "frames": frames,
+                "references": len(addresses),
+                "faults": faults,
+                "fault_rate": faults / len(addresses) if len(addresses) else 0.0,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    # Classic reference string 7 0 1 2 0 3 0 4 2 3 0 3 2 1 2 0 1 7 0 1, one page each
+    reference = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+    fd, path = tempfile.mkstemp(suffix=".trace")
+    os.close(fd)
+    try:
+        writeTrace(path, [page * pageSize for page in reference])
+        for row in simulateTrace(path, frames=3):
+            print(f"{row['policy']:<6} faults={row['faults']:<3} fault rate={row['fault_rate']:.2f}")
+    finally:
+        os.remove(path)
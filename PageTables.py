@@ -0,0 +1,225 @@
+# Page tables for large, sparse address spaces, as alternatives to the single
+# flat pageMapTable in Pagging.py:
+#   - MultiLevelPageTable: 2- or 4-level radix tree whose inner tables are only
+#     allocated once a page below them is mapped
+#   - InvertedPageTable: one entry per physical frame, found through a hash
+#     anchor table with chaining
+# Both take the address width and page size as parameters, count the memory
+# accesses each translation costs (table reads plus the data access itself)
+# and report their own memory footprint, so space/time trade-offs can be
+# compared on the same workload. A TLB from Pagging.py can sit in front of either;
+# each table remembers the TLB last passed to translate() and invalidates a page's
+# entry there whenever map/unmap changes that page, so it never hands out a stale frame.
+
+
+def flatFootprint(addressBits=32, pageBits=12, pteSize=8):
+    # Bytes a single-level table covering the whole address space would need
+    return (1 << (addressBits - pageBits)) * pteSize
+
+
+class MultiLevelPageTable:
+    def __init__(self, addressBits=32, pageBits=12, levels=2, pteSize=8):
+        if not 1 <= levels <= addressBits - pageBits:
+            raise ValueError("levels must be between 1 and the number of page-number bits")
+        self.addressBits = addressBits
+        self.pageBits = pageBits
+        self.levels = levels
+        self.pteSize = pteSize
+        # Split the page-number bits over the levels; the top level takes the rest
+        vpnBits = addressBits - pageBits
+        low = vpnBits // levels
+        self.indexBits = [vpnBits - low * (levels - 1)] + [low] * (levels - 1)
+        self.root = [None] * (1 << self.indexBits[0])
+        self.tableEntries = len(self.root)  # PTE slots allocated so far, over all tables
+        self.tlb = None  # TLB caching this table's translations
+        self.translations = 0
+        self.memoryAccesses = 0
+
+    def _indexes(self, pageNumber):
+        shift = sum(self.indexBits)
+        for bits in self.indexBits:
+            shift -= bits
+            yield (pageNumber >> shift) & ((1 << bits) - 1)
+
+    def _checkPage(self, pageNumber):
+        if not 0 <= pageNumber < 1 << (self.addressBits - self.pageBits):
+            raise ValueError("page number outside the address space")
+
+    def map(self, pageNumber, frameNumber):
+        self._checkPage(pageNumber)
+        indexes = list(self._indexes(pageNumber))
+        table = self.root
+        for level, index in enumerate(indexes[:-1]):
+            if table[index] is None:
+                # Allocate the next-level table on first use
+                table[index] = [None] * (1 << self.indexBits[level + 1])
+                self.tableEntries += len(table[index])
+            table = table[index]
+        table[indexes[-1]] = frameNumber
+        if self.tlb is not None:
+            self.tlb.invalidate(pageNumber)  # a remap must not leave the old frame cached
+
+    def unmap(self, pageNumber):
+        self._checkPage(pageNumber)
+        if self.tlb is not None:
+            self.tlb.invalidate(pageNumber)
+        table = self.root
+        indexes = list(self._indexes(pageNumber))
+        for index in indexes[:-1]:
+            table = table[index]
+            if table is None:
+                return
+        table[indexes[-1]] = None
+
+    def lookup(self, pageNumber):
+        # (frame or None, table reads the walk took)
+        self._checkPage(pageNumber)
+        table, reads = self.root, 0
+        for index in self._indexes(pageNumber):
+            reads += 1
+            table = table[index]
+            if table is None:
+                return None, reads
+        return table, reads
+
+    def translate(self, logicalAddress, tlb=None):
+        pageNumber = logicalAddress >> self.pageBits
+        offset = logicalAddress & ((1 << self.pageBits) - 1)
+        self.translations += 1
+        if tlb is not None:
+            self.tlb = tlb
+        frameNumber = tlb.lookup(pageNumber) if tlb is not None else None
+        if frameNumber is None:
+            frameNumber, reads = self.lookup(pageNumber)
+            self.memoryAccesses += reads
+            if frameNumber is None:
+                raise ValueError("Invalid logical address: page not mapped")
+            if tlb is not None:
+                tlb.insert(pageNumber, frameNumber)
+        self.memoryAccesses += 1  # the data access itself
+        return (frameNumber << self.pageBits) | offset
+
+    def averageAccessCost(self):
+        return self.memoryAccesses / self.translations if self.translations else 0.0
+
+    def footprint(self):
+        return self.tableEntries * self.pteSize
+
+
+class InvertedPageTable:
+    # Entries are indexed by frame and hold (pid, page). hash(pid, page) picks an
+    # anchor slot pointing at the first frame of its chain; each entry links to
+    # the next frame with the same hash. Size depends only on physical memory.
+    def __init__(self, frames, addressBits=32, pageBits=12, entrySize=16, anchorSize=4):
+        self.frames = frames
+        self.addressBits = addressBits
+        self.pageBits = pageBits
+        self.entrySize = entrySize    # pid + page + chain link per frame
+        self.anchorSize = anchorSize  # one frame index per anchor slot
+        anchors = 1
+        while anchors < frames:
+            anchors *= 2
+        self.anchor = [-1] * anchors
+        self.owner = [None] * frames  # frame -> (pid, page)
+        self.chain = [-1] * frames    # frame -> next frame in the same hash chain
+        self.tlb = None               # TLB caching this table's translations
+        self.tlbPid = None            # process whose pages the TLB currently holds
+        self.translations = 0
+        self.memoryAccesses = 0
+
+    def _slot(self, pid, pageNumber):
+        return hash((pid, pageNumber)) & (len(self.anchor) - 1)
+
+    def map(self, pageNumber, frameNumber, pid=0):
+        # A frame holds one page and a page lives in one frame
+        previous = self.lookup(pageNumber, pid)[0]
+        if previous is not None:
+            self.unmapFrame(previous)
+        if self.owner[frameNumber] is not None:
+            self.unmapFrame(frameNumber)
+        slot = self._slot(pid, pageNumber)
+        self.owner[frameNumber] = (pid, pageNumber)
+        self.chain[frameNumber] = self.anchor[slot]
+        self.anchor[slot] = frameNumber
+
+    def unmapFrame(self, frameNumber):
+        pid, pageNumber = self.owner[frameNumber]
+        if self.tlb is not None and pid == self.tlbPid:
+            # Only the current process's pages can be cached; covers remaps too,
+            # since map() unmaps the page's old frame first
+            self.tlb.invalidate(pageNumber)
+        slot = self._slot(pid, pageNumber)
+        if self.anchor[slot] == frameNumber:
+            self.anchor[slot] = self.chain[frameNumber]
+        else:
+            frame = self.anchor[slot]
+            while self.chain[frame] != frameNumber:
+                frame = self.chain[frame]
+            self.chain[frame] = self.chain[frameNumber]
+        self.owner[frameNumber] = None
+        self.chain[frameNumber] = -1
+
+    def lookup(self, pageNumber, pid=0):
+        # (frame or None, table reads: the anchor plus every chain entry visited)
+        frame, reads = self.anchor[self._slot(pid, pageNumber)], 1
+        while frame != -1:
+            reads += 1
+            if self.owner[frame] == (pid, pageNumber):
+                return frame, reads
+            frame = self.chain[frame]
+        return None, reads
+
+    def translate(self, logicalAddress, pid=0, tlb=None):
+        pageNumber = logicalAddress >> self.pageBits
+        offset = logicalAddress & ((1 << self.pageBits) - 1)
+        self.translations += 1
+        if tlb is not None and (pid != self.tlbPid or tlb is not self.tlb):
+            # The TLB is keyed by page number alone, so switching processes
+            # flushes it, as a context switch does without address-space IDs
+            tlb.flush()
+            self.tlb = tlb
+            self.tlbPid = pid
+        frameNumber = tlb.lookup(pageNumber) if tlb is not None else None
+        if frameNumber is None:
+            frameNumber, reads = self.lookup(pageNumber, pid)
+            self.memoryAccesses += reads
+            if frameNumber is None:
+                raise ValueError("Invalid logical address: page not mapped")
+            if tlb is not None:
+                tlb.insert(pageNumber, frameNumber)
+        self.memoryAccesses += 1
+        return (frameNumber << self.pageBits) | offset
+
+    def averageAccessCost(self):
+        return self.memoryAccesses / self.translations if self.translations else 0.0
+
+    def footprint(self):
+        return self.frames * self.entrySize + len(self.anchor) * self.anchorSize
+
+
+def compareTables(pages, addressBits=32, pageBits=12, levels=(2, 4)):
+    # Maps the given (sparse) page numbers to frames 0..n-1 in each kind of table,
+    # translates one address per page, and returns footprint and average
+    # memory accesses per translation for each
+    pages = list(pages)
+    tables = [(f"{n}-level", MultiLevelPageTable(addressBits, pageBits, n)) for n in levels]
+    tables.append(("inverted", InvertedPageTable(max(len(pages), 1), addressBits, pageBits)))
+    rows = [{"table": "flat", "footprint_bytes": flatFootprint(addressBits, pageBits), "avg_memory_accesses": 2.0}]
+    for name, table in tables:
+        for frame, page in enumerate(pages):
+            table.map(page, frame)
+        for page in pages:
+            table.translate(page << pageBits)
+        rows.append({"table": name, "footprint_bytes": table.footprint(),
+                     "avg_memory_accesses": table.averageAccessCost()})
+    return rows
+
+
+if __name__ == "__main__":
+    import random
+    rng = random.Random(0)
+    # 1000 pages scattered over a 48-bit address space with 4 KiB pages
+    pages = rng.sample(range(1 << 36), 1000)
+    for row in compareTables(pages, addressBits=48, pageBits=12, levels=(4,)):
+        print(f"{row['table']:<9} {row['footprint_bytes']:>16,} bytes  "
+              f"{row['avg_memory_accesses']:.2f} accesses/translation")
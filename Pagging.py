@@ -2,6 +2,17 @@
 # by mapping logical address to physical address
 # using a page map table where the page offset is 7
 
+import random
+from array import array
+from collections import OrderedDict
+
+import Instrumentation
+
+try:
+    import numpy as np
+except ImportError:  # batch translation falls back to plain Python without NumPy
+    np = None
+
 pageOffset = 7
 pageSize = 1 << pageOffset  # 2^7 = 128 bytes
 
@@ -14,16 +25,165 @@ pageMapTable = {
     4: 2
 }
 
-def logicalToPhysical(logicalAddress):
+def logicalToPhysical(logicalAddress, tlb=None):
     pageNumber = logicalAddress >> pageOffset  # logicalAddress // pageSize
     offset = logicalAddress & (pageSize - 1)   # logicalAddress % pageSize
-    if pageNumber >= len(pageMapTable):
-        raise ValueError("Invalid logical address: page number out of range")
-    frameNumber = pageMapTable[pageNumber]
+    # check the TLB first when one is given; only a miss goes to the page map table
+    frameNumber = tlb.lookup(pageNumber) if tlb is not None else None
+    if frameNumber is None:
+        # membership, not len(): page numbers in a sparse table need not be contiguous
+        if pageNumber not in pageMapTable:
+            raise ValueError("Invalid logical address: page number out of range")
+        frameNumber = pageMapTable[pageNumber]
+        if tlb is not None:
+            tlb.insert(pageNumber, frameNumber)
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("page_table_lookups")
+    elif Instrumentation.profiler is not None:
+        Instrumentation.count("tlb_hits")
     physicalAddress = (frameNumber * pageSize) + offset
     return physicalAddress
 
+# Translation lookaside buffer: `entries` slots split into sets of `ways`
+# (ways=None means fully associative). A page always maps to set
+# page % numSets; within a set the victim is chosen by LRU, FIFO or random.
+# Times are in the same unit (e.g. ns) and feed effectiveAccessTime().
+class TLB:
+    POLICIES = ("lru", "fifo", "random")
+
+    def __init__(self, entries=16, ways=None, policy="lru", tlbTime=1, memoryTime=100, seed=0):
+        ways = ways or entries
+        if entries <= 0 or entries % ways:
+            raise ValueError("entries must be a positive multiple of ways")
+        if policy not in self.POLICIES:
+            raise ValueError(f"policy must be one of {self.POLICIES}, got {policy!r}")
+        self.entries = entries
+        self.ways = ways
+        self.policy = policy
+        self.tlbTime = tlbTime
+        self.memoryTime = memoryTime
+        self.numSets = entries // ways
+        self.sets = [OrderedDict() for _ in range(self.numSets)]  # page -> frame, oldest first
+        self.rng = random.Random(seed)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, pageNumber):
+        # frame number on a hit, None on a miss
+        entries = self.sets[pageNumber % self.numSets]
+        frameNumber = entries.get(pageNumber)
+        if frameNumber is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            entries.move_to_end(pageNumber)
+        return frameNumber
+
+    def insert(self, pageNumber, frameNumber):
+        entries = self.sets[pageNumber % self.numSets]
+        if pageNumber not in entries and len(entries) >= self.ways:
+            if self.policy == "random":
+                del entries[self.rng.choice(list(entries))]
+            else:
+                entries.popitem(last=False)  # LRU and FIFO both evict the front
+        entries[pageNumber] = frameNumber
+
+    def invalidate(self, pageNumber):
+        # drop one page's entry, e.g. after its mapping changed; a no-op if not cached
+        self.sets[pageNumber % self.numSets].pop(pageNumber, None)
+
+    def flush(self):
+        for entries in self.sets:
+            entries.clear()
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def effectiveAccessTime(self):
+        # hit: TLB + memory access; miss: TLB + page table access + memory access
+        h = self.hitRate()
+        return h * (self.tlbTime + self.memoryTime) + (1 - h) * (self.tlbTime + 2 * self.memoryTime)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hitRate(),
+            "miss_rate": 1 - self.hitRate() if self.hits + self.misses else 0.0,
+            "effective_access_time": self.effectiveAccessTime(),
+        }
+
+# Dense page -> frame lookup array for a page table, -1 marking unmapped pages
+def buildFrameArray(table=pageMapTable):
+    size = max(table) + 1 if table else 0
+    frames = array('q', [-1]) * size
+    for page, frame in table.items():
+        frames[page] = frame
+    return frames
+
+# Translate a whole batch of logical addresses (list, array, NumPy array or
+# memoryview) at once with shift/mask and a frame-array lookup.
+# Returns (physicalAddresses, valid): invalid pages come back as -1 with
+# valid False instead of raising on the first one.
+def translateBatch(logicalAddresses, table=pageMapTable):
+    with Instrumentation.phase("translateBatch"):
+        physical, valid = _translateBatch(logicalAddresses, table)
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("addresses", len(valid))
+        mapped = np.count_nonzero(valid) if np is not None else sum(valid)
+        Instrumentation.count("invalid", len(valid) - int(mapped))
+    return physical, valid
+
+def _translateBatch(logicalAddresses, table):
+    if np is None:
+        return _translateBatchPython(logicalAddresses, table)
+
+    addresses = np.asarray(logicalAddresses).astype(np.int64, copy=False)
+    pages = addresses >> pageOffset
+    offsets = addresses & (pageSize - 1)
+
+    maxPage = max(table) + 1 if table else 0
+    if maxPage <= 4 * len(table) + (1 << 16):
+        # Compact table: index a dense frame array directly
+        frames = np.asarray(buildFrameArray(table))
+        inRange = (pages >= 0) & (pages < maxPage)
+        found = frames[np.where(inRange, pages, 0)] if maxPage else np.full(pages.shape, -1)
+        valid = inRange & (found >= 0)
+    else:
+        # Very sparse table: binary-search the sorted page numbers instead
+        keys = np.fromiter(sorted(table), dtype=np.int64, count=len(table))
+        values = np.fromiter((table[k] for k in keys.tolist()), dtype=np.int64, count=len(table))
+        slot = np.minimum(np.searchsorted(keys, pages), len(keys) - 1)
+        valid = keys[slot] == pages
+        found = values[slot]
+
+    physical = np.where(valid, (found << pageOffset) | offsets, -1)
+    return physical, valid
+
+def _translateBatchPython(logicalAddresses, table):
+    physical = array('q')
+    valid = array('b')
+    mask = pageSize - 1
+    for address in logicalAddresses:
+        frame = table.get(address >> pageOffset)
+        if frame is None or address < 0:
+            physical.append(-1)
+            valid.append(0)
+        else:
+            physical.append((frame << pageOffset) | (address & mask))
+            valid.append(1)
+    return physical, valid
+
 # Example
-logicalAddress = 300
-physicalAddress = logicalToPhysical(logicalAddress)
-print(f"Logical Address: {logicalAddress} maps to Physical Address: {physicalAddress}")
\ No newline at end of file
+if __name__ == "__main__":
+    logicalAddress = 300
+    physicalAddress = logicalToPhysical(logicalAddress)
+    print(f"Logical Address: {logicalAddress} maps to Physical Address: {physicalAddress}")
+
+    # Same lookups through a small TLB
+    tlb = TLB(entries=4, ways=2, policy="lru")
+    for address in [300, 310, 20, 300, 600, 140, 300]:
+        logicalToPhysical(address, tlb)
+    print(f"TLB: {tlb.stats()}")
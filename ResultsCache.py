@@ -0,0 +1,233 @@
+# Content-addressed cache for simulation results, so repeated comparison runs
+# on the same workloads only compute the cells that changed.
+#
+# A result is stored under the hash of (version, algorithm, code fingerprint,
+# parameters, workload digest). The workload digest covers the data itself,
+# not object identity: a ProcessTable hashes its typed columns as raw bytes, so
+# even a table mapped from a multi-GB trace is digested at memory speed, and a
+# list of process dicts hashes every key and value. The code fingerprint is
+# the hash of the source file defining the algorithm, so editing that module
+# retires its old entries on its own; `version` is still there for changes the
+# fingerprint cannot see, such as a helper imported from another module.
+# Two tiers sit behind the key:
+#
+#   memory  an LRU of the last max_entries results, kept pickled
+#   disk    one pickle per key in `directory`, evicted least recently used
+#           first once the files add up to more than max_bytes
+#
+# Both tiers hold pickled bytes, so every get() unpickles a private copy and
+# callers may sort or modify what they are handed without touching the cache.
+# The callers (data.run_comparison, compare_algorithms, compare_core_counts and
+# ContiguousMemoryAllocation's compare_allocators / compare_fits) only use
+# digest(), key(), get() and put().
+
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+
+from SchedulingAlgorithms.Scheduling import ProcessTable
+
+SUFFIX = ".pickle"
+TMP_SUFFIX = ".tmp"
+# A temporary file this old was left behind by a writer that died before
+# renaming it; younger ones may still be in the middle of a put()
+STALE_TMP_SECONDS = 3600
+
+_source_digests = {}  # source file path -> its hash, per process
+
+
+def fingerprint(code):
+    """Hash of the source file defining `code` (a function or class), or of
+    its bytecode when it has no source file."""
+    module = sys.modules.get(getattr(code, "__module__", None))
+    path = getattr(module, "__file__", None)
+    if path is not None:
+        if path not in _source_digests:
+            with open(path, "rb") as f:
+                _source_digests[path] = hashlib.blake2b(f.read(), digest_size=20).hexdigest()
+        return f"{_source_digests[path]}:{code.__qualname__}"
+    return hashlib.blake2b(marshal.dumps(code.__code__), digest_size=20).hexdigest()
+
+
+def _feed(h, obj):
+    # Type-tagged, length-prefixed encoding, so different values never feed
+    # the same byte stream (e.g. [1, 2] vs [12] or 1 vs "1")
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, bytes):
+        h.update(f"bytes:{len(obj)};".encode())
+        h.update(obj)
+    elif isinstance(obj, ProcessTable):
+        h.update(f"table:{obj.time_type};".encode())
+        for column in (obj.pid, obj.arrival, obj.burst, obj.priority):
+            _feed(h, column)
+        _feed(h, obj.rows)
+    elif isinstance(obj, (array, memoryview)):
+        view = memoryview(obj)
+        h.update(f"buffer:{view.format}:{len(view)};".encode())
+        h.update(view.cast('B') if view.c_contiguous else view.tobytes())
+    elif hasattr(obj, "dtype") and hasattr(obj, "tobytes"):  # NumPy array
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        h.update(obj.tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"seq:{len(obj)};".encode())
+        for item in obj:
+            _feed(h, item)
+    elif isinstance(obj, dict):
+        h.update(f"dict:{len(obj)};".encode())
+        for key in sorted(obj, key=repr):
+            _feed(h, key)
+            _feed(h, obj[key])
+    else:
+        raise TypeError(f"cannot digest a {type(obj).__name__}")
+
+
+class ResultsCache:
+    def __init__(self, max_entries=128, directory=None, max_bytes=1 << 30, version=""):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.memory = OrderedDict()  # key -> result, least recently used first
+        self.files = OrderedDict()   # key -> file size, least recently used first
+        self.disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._scan()
+
+    def _scan(self):
+        # Rebuild the disk index from an earlier run, oldest access first,
+        # and remove temporary files that writers left behind
+        entries = []
+        stale = time.time() - STALE_TMP_SECONDS
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(SUFFIX):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(SUFFIX)], stat.st_size))
+            elif entry.name.endswith(TMP_SUFFIX) and entry.stat().st_mtime < stale:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+        for _, key, size in sorted(entries):
+            self.files[key] = size
+            self.disk_bytes += size
+        self._evict()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def digest(self, workload):
+        """Content hash of a workload (ProcessTable, list of process dicts,
+        arrays, event lists, ...). Compute it once and reuse it for every
+        algorithm run on that workload."""
+        h = hashlib.blake2b(digest_size=20)
+        _feed(h, workload)
+        return h.hexdigest()
+
+    def key(self, algorithm, digest, code=None, **params):
+        """Key for running `algorithm` (a name) on a workload digest with
+        params. Pass the function or class that computes the result as code
+        to tie the entry to the source it was computed with."""
+        h = hashlib.blake2b(digest_size=20)
+        _feed(h, (self.version, algorithm, fingerprint(code) if code is not None else None, params, digest))
+        return h.hexdigest()
+
+    def get(self, key):
+        """A fresh copy of the cached result, or None on a miss."""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return pickle.loads(self.memory[key])
+        if key in self.files:
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+                value = pickle.loads(data)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                # Removed or left half-written by another process: a miss
+                self._forget(key)
+            else:
+                self.files.move_to_end(key)
+                os.utime(self._path(key))  # keeps the LRU order across runs
+                self._remember(key, data)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        # Pickled right away, so later changes to value do not reach the cache
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, data)
+        if self.directory is None:
+            return
+        if len(data) > self.max_bytes:
+            return  # would evict everything else and still not fit
+        # Write next to the target and rename, so readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=TMP_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.remove(tmp)
+            raise
+        self.disk_bytes += len(data) - self.files.pop(key, 0)
+        self.files[key] = len(data)
+        self._evict()
+
+    def memoize(self, algorithm, workload, compute, code=None, **params):
+        """compute() on a miss, the stored result on a hit."""
+        key = self.key(algorithm, self.digest(workload), code, **params)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _remember(self, key, data):
+        self.memory[key] = data
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _forget(self, key):
+        self.disk_bytes -= self.files.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        while self.disk_bytes > self.max_bytes and self.files:
+            self._forget(next(iter(self.files)))
+
+    def clear(self):
+        self.memory.clear()
+        for key in list(self.files):
+            self._forget(key)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_entries": len(self.files),
+            "disk_bytes": self.disk_bytes,
+        }
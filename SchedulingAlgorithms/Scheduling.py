@@ -1,20 +1,359 @@
 # Algorithms/Scheduling.py
 
-from typing import List, Dict
+import heapq
+from array import array
+from collections import deque
+from itertools import islice
+from operator import ne
+from typing import List, Dict, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; every path below has a pure-Python fallback
+    np = None
+
+import Instrumentation
+
+
+# Columnar process table: one typed array per field instead of one dict per
+# process. Times are stored as int64 ('q') while every arrival/burst is an
+# int and switch to float64 ('d') as soon as a float shows up. The input
+# columns may also be read-only memoryviews, e.g. onto a memory-mapped binary
+# trace; they are only ever read, and results go into separate columns.
+# PIDs are int64 too unless one is not an int (e.g. a name), in which case the
+# column is a plain list; priorities widen from int64 to float64 to a list.
+class ProcessTable:
+    """Parallel typed arrays holding the input and results of a schedule."""
+
+    __slots__ = ('pid', 'arrival', 'burst', 'priority', '_start', '_completion',
+                 'remaining', 'time_type', 'unset', 'rows')
+
+    def __init__(self, pid, arrival, burst, priority=None, time_type='q', rows=None):
+        n = len(pid)
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority if priority is not None else array('q', bytes(8 * n))
+        self.time_type = time_type
+        # Marker for "not scheduled yet"; compares equal to itself, unlike NaN
+        self.unset = -2 ** 63 if time_type == 'q' else float('-inf')
+        # Result columns are allocated on first use, so opening a large trace
+        # does not pay for columns that a scheduler run replaces anyway
+        self._start = self._completion = None
+        self.remaining = None
+        # Source dicts, kept only so to_dicts() can return the caller's extra keys
+        self.rows = rows
+
+    @property
+    def start(self):
+        if self._start is None:
+            self._start = array(self.time_type, [self.unset]) * len(self.pid)
+        return self._start
+
+    @property
+    def completion(self):
+        if self._completion is None:
+            self._completion = array(self.time_type, [self.unset]) * len(self.pid)
+        return self._completion
+
+    @classmethod
+    def from_rows(cls, rows, keep_rows=False, chunk_size=1 << 16):
+        """Build a table from an iterable of process dicts in a single pass.
+
+        Rows are consumed chunk_size at a time and each field of a chunk is
+        converted to its typed column in bulk, which is several times faster
+        than appending per row. Only one chunk of dicts is held at a time
+        (unless keep_rows), so a generator is never materialised.
+        """
+        pid, priority = array('q'), array('q')
+        arrival, burst = array('q'), array('q')
+        kept = [] if keep_rows else None
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if kept is not None:
+                kept.extend(chunk)
+            at = [p['ArrivalTime'] for p in chunk]
+            bt = [p['BurstTime'] for p in chunk]
+            if arrival.typecode == 'q':
+                try:
+                    at, bt = array('q', at), array('q', bt)
+                except TypeError:  # a float somewhere: both time columns become float64
+                    arrival, burst = array('d', arrival), array('d', burst)
+            if arrival.typecode == 'd':
+                at, bt = array('d', at), array('d', bt)
+            arrival.extend(at)
+            burst.extend(bt)
+            pid = _extend_column(pid, [p['PID'] for p in chunk], ('q',))
+            priority = _extend_column(priority, [p.get('Priority', 0) for p in chunk], ('q', 'd'))
+        return cls(pid, arrival, burst, priority, arrival.typecode, kept)
+
+    @classmethod
+    def from_dicts(cls, processes: List[Dict]):
+        return cls.from_rows(processes, keep_rows=True)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __reduce__(self):
+        # Views onto a mapped trace cannot be pickled (for a process pool or
+        # the results cache), so they travel as arrays of the same type
+        columns = [array(c.format, c) if isinstance(c, memoryview) else c
+                   for c in (self.pid, self.arrival, self.burst, self.priority)]
+        state = {'_start': self._start, '_completion': self._completion, 'remaining': self.remaining}
+        return ProcessTable, (*columns, self.time_type, self.rows), (None, state)
+
+    def with_empty_results(self):
+        """Fresh result columns over the same (shared, not copied) input columns."""
+        return ProcessTable(self.pid, self.arrival, self.burst, self.priority,
+                            self.time_type, self.rows)
+
+    def to_dicts(self, order=None) -> List[Dict]:
+        """Adapter back to the list-of-dicts format used by format_results."""
+        rows, unset = self.rows, self.unset
+        # Plain lists index much faster than typed arrays or memoryviews
+        start, completion = self.start.tolist(), self.completion.tolist()
+        arrival, burst = self.arrival.tolist(), self.burst.tolist()
+        remaining = self.remaining.tolist() if self.remaining is not None else None
+        if rows is None:
+            pid, priority = _tolist(self.pid), _tolist(self.priority)
+        if order is None:
+            order = range(len(self))
+        elif not isinstance(order, (list, range)):
+            order = order.tolist()  # NumPy index array: its scalars index lists slowly
+        out = []
+        for i in order:
+            if rows is not None:
+                p = rows[i].copy()
+            else:
+                p = {'PID': pid[i], 'ArrivalTime': arrival[i],
+                     'BurstTime': burst[i], 'Priority': priority[i]}
+            s = start[i]
+            if s != unset:
+                p['StartTime'] = s
+            c = completion[i]
+            if c != unset:
+                turnaround = c - arrival[i]
+                p['CompletionTime'] = c
+                p['TurnaroundTime'] = turnaround
+                p['WaitingTime'] = turnaround - burst[i]
+            if remaining is not None:
+                p['RemainingTime'] = remaining[i]
+            out.append(p)
+        return out
+
+
+def _extend_column(column, values, typecodes):
+    """Appends values to a column, widening it along typecodes and then to a
+    plain list the first time a value does not fit; returns the column."""
+    while isinstance(column, array):
+        try:
+            column.extend(array(column.typecode, values))
+            return column
+        except (TypeError, OverflowError):
+            wider = typecodes[typecodes.index(column.typecode) + 1:]
+            column = array(wider[0], column) if wider else list(column)
+    column.extend(values)
+    return column
+
+
+def _tolist(column):
+    return column if isinstance(column, list) else column.tolist()
+
+
+# Gantt chart kept as parallel NumPy columns instead of a list of tuples, for
+# schedules computed in bulk. Indexing and iteration still give (pid, start,
+# end) tuples, so it reads like the list the other schedulers return.
+class GanttColumns:
+    __slots__ = ('pid', 'start', 'end')
+
+    def __init__(self, pid, start, end):
+        self.pid, self.start, self.end = pid, start, end
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return GanttColumns(self.pid[k], self.start[k], self.end[k])
+        return self.pid[k].item(), self.start[k].item(), self.end[k].item()
+
+    def __iter__(self):
+        return zip(self.pid.tolist(), self.start.tolist(), self.end.tolist())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"GanttColumns({len(self)} segments)"
+
+    def tolist(self):
+        return list(self)
+
+
+def _as_table(processes, *times) -> ProcessTable:
+    table = processes.with_empty_results() if isinstance(processes, ProcessTable) \
+        else ProcessTable.from_dicts(processes)
+    # A float time slice, aging step or boost period puts float times into
+    # the results, so an integer table is promoted like a float in the input
+    if table.time_type == 'q' and any(isinstance(t, float) for t in times):
+        table = ProcessTable(table.pid, array('d', table.arrival), array('d', table.burst),
+                             table.priority, 'd', table.rows)
+    return table
+
+
+# Hand results back in the caller's format: a table stays a table,
+# a list of dicts gets a list of dicts.
+def _results(processes, table, gantt, order=None):
+    with Instrumentation.phase("metrics"):
+        metrics = calculate_metrics(table, gantt)
+    if Instrumentation.profiler is not None:
+        _count_schedule(table, gantt, metrics)
+    if isinstance(processes, ProcessTable):
+        return table, metrics, gantt
+    return table.to_dicts(order), metrics, gantt
+
+
+def _count_schedule(table, gantt, metrics):
+    # A process is preempted each time it leaves the CPU unfinished, i.e. once
+    # for every Gantt segment beyond its first
+    Instrumentation.count("processes", len(table))
+    Instrumentation.count("gantt_segments", len(gantt))
+    Instrumentation.count("preemptions", len(gantt) - len(set(seg[0] for seg in gantt)))
+    Instrumentation.count("context_switches", metrics["context_switches"])
+
+
+# Linear-interpolated percentile of an already sorted list (same as NumPy's default)
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _empty_metrics():
+    return {
+        "average_waiting_time": 0.0,
+        "average_turnaround_time": 0.0,
+        "throughput": 0.0,
+        "p50_waiting_time": 0.0,
+        "p95_waiting_time": 0.0,
+        "p99_waiting_time": 0.0
+    }
+
+
+# Number of times the CPU is handed to a different process. Back-to-back
+# slices of the same process (with or without idle time between) are not a switch.
+def count_context_switches(gantt):
+    if isinstance(gantt, GanttColumns):
+        return int(np.count_nonzero(gantt.pid[1:] != gantt.pid[:-1]))
+    pids = [segment[0] for segment in gantt]
+    return sum(map(ne, pids, islice(pids, 1, None)))
+
+
+# Helper: calculate averages + throughput + waiting time percentiles,
+# plus context switches when the Gantt chart is given. For a multi-core run
+# pass the per-core lanes instead to also get each core's utilisation and the
+# load imbalance.
+def calculate_metrics(processes, gantt=None, lanes=None):
+    if not isinstance(processes, ProcessTable):
+        metrics = _calculate_metrics_dicts(processes)
+    elif np is not None:
+        metrics = _calculate_metrics_numpy(processes)
+    else:
+        metrics = _calculate_metrics_python(processes)
+    if gantt is not None:
+        metrics["context_switches"] = count_context_switches(gantt)
+    if lanes is not None:
+        metrics.update(_core_metrics(lanes))
+    return metrics
+
+
+# Utilisation is each core's busy time over the whole run (first slice start to
+# last slice end on any core). Load imbalance is max/mean busy time - 1:
+# 0 when every core did the same amount of work.
+def _core_metrics(lanes):
+    busy = [sum(end - start for _, start, end in lane) for lane in lanes]
+    starts = [lane[0][1] for lane in lanes if lane]
+    span = max(lane[-1][2] for lane in lanes if lane) - min(starts) if starts else 0
+    mean = sum(busy) / len(busy) if busy else 0
+    return {
+        "context_switches": sum(count_context_switches(lane) for lane in lanes),
+        "core_utilisation": [b / span if span > 0 else 0.0 for b in busy],
+        "load_imbalance": max(busy) / mean - 1 if mean > 0 else 0.0
+    }
 
 
-# Helper: calculate averages + throughput
-def calculate_metrics(processes):
+def _calculate_metrics_python(processes: ProcessTable):
+    n = len(processes)
+    arrival, burst = processes.arrival, processes.burst
+    completion, unset = processes.completion, processes.unset
+    waiting = []
+    total_turnaround_time = 0
+    first_arrival = last_completion_time = None
+    for i in range(n):
+        c = completion[i]
+        if c == unset:
+            continue
+        turnaround = c - arrival[i]
+        total_turnaround_time += turnaround
+        waiting.append(turnaround - burst[i])
+        if first_arrival is None or arrival[i] < first_arrival:
+            first_arrival = arrival[i]
+        if last_completion_time is None or c > last_completion_time:
+            last_completion_time = c
+    if not waiting:
+        return _empty_metrics()
+
+    waiting.sort()
+    makespan = last_completion_time - first_arrival
+
+    return {
+        "average_waiting_time": sum(waiting) / n,
+        "average_turnaround_time": total_turnaround_time / n,
+        "throughput": n / makespan if makespan > 0 else float('inf'),
+        "p50_waiting_time": _percentile(waiting, 50),
+        "p95_waiting_time": _percentile(waiting, 95),
+        "p99_waiting_time": _percentile(waiting, 99)
+    }
+
+
+# Same figures as calculate_metrics, computed in bulk over zero-copy column views
+def _calculate_metrics_numpy(table: ProcessTable):
+    n = len(table)
+    completion = np.asarray(table.completion)
+    done = completion != table.unset
+    if not done.any():
+        return _empty_metrics()
+
+    arrival = np.asarray(table.arrival)[done]
+    turnaround = completion[done] - arrival
+    waiting = turnaround - np.asarray(table.burst)[done]
+    makespan = (completion[done].max() - arrival.min()).item()
+    p50, p95, p99 = np.percentile(waiting, [50, 95, 99]).tolist()
+
+    return {
+        "average_waiting_time": waiting.sum().item() / n,
+        "average_turnaround_time": turnaround.sum().item() / n,
+        "throughput": n / makespan if makespan > 0 else float('inf'),
+        "p50_waiting_time": p50,
+        "p95_waiting_time": p95,
+        "p99_waiting_time": p99
+    }
+
+
+def _calculate_metrics_dicts(processes):
     n = len(processes)
     completed_processes = [p for p in processes if 'CompletionTime' in p]
     if len(completed_processes) == 0:
-        return {
-            "average_waiting_time": 0.0,
-            "average_turnaround_time": 0.0,
-            "throughput": 0.0
-        }
+        return _empty_metrics()
 
-    total_waiting_time = sum(p['WaitingTime'] for p in completed_processes)
+    waiting = sorted(p['WaitingTime'] for p in completed_processes)
+    total_waiting_time = sum(waiting)
     total_turnaround_time = sum(p['TurnaroundTime'] for p in completed_processes)
     first_arrival = min(p['ArrivalTime'] for p in completed_processes)
     last_completion_time = max(p['CompletionTime'] for p in completed_processes)
@@ -23,116 +362,539 @@ def calculate_metrics(processes):
     return {
         "average_waiting_time": total_waiting_time / n,
         "average_turnaround_time": total_turnaround_time / n,
-        "throughput": n / makespan if makespan > 0 else float('inf')
+        "throughput": n / makespan if makespan > 0 else float('inf'),
+        "p50_waiting_time": _percentile(waiting, 50),
+        "p95_waiting_time": _percentile(waiting, 95),
+        "p99_waiting_time": _percentile(waiting, 99)
     }
 
 
 # FCFS
-def fcfs(processes: List[Dict]):
-    procs = [p.copy() for p in processes]
-    procs.sort(key=lambda x: (x['ArrivalTime'], x['PID']))
-    time, gantt = 0, []
-    for p in procs:
-        if time < p['ArrivalTime']:
-            time = p['ArrivalTime']
-        p['StartTime'], p['CompletionTime'] = time, time + p['BurstTime']
-        p['TurnaroundTime'] = p['CompletionTime'] - p['ArrivalTime']
-        p['WaitingTime'] = p['TurnaroundTime'] - p['BurstTime']
-        gantt.append((p['PID'], p['StartTime'], p['CompletionTime']))
-        time = p['CompletionTime']
-    return procs, calculate_metrics(procs), gantt
-
-
-# SJF (non-preemptive)
-def sjf(processes: List[Dict]):
-    procs = [p.copy() for p in processes]
-    time, done, gantt = 0, 0, []
-    procs_dict = {p['PID']: p for p in procs}
+def fcfs(processes: Union[List[Dict], ProcessTable]):
+    table = _as_table(processes)
+    with Instrumentation.phase("schedule"):
+        # The closed form needs numeric PIDs to break arrival ties
+        if np is not None and table.time_type != 'd' and not isinstance(table.pid, list):
+            order, gantt = _fcfs_numpy(table)
+            if not isinstance(processes, ProcessTable):
+                gantt = gantt.tolist()
+        else:
+            order, gantt = _fcfs_python(table)
+    return _results(processes, table, gantt, order)
 
-    while done < len(procs):
-        available = [p for p in procs if p.get('StartTime') is None and p['ArrivalTime'] <= time]
 
-        if not available:
-            unstarted = [p for p in procs if p.get('StartTime') is None]
-            if not unstarted:
-                break
-            time = min(p['ArrivalTime'] for p in unstarted)
+def _fcfs_python(table: ProcessTable):
+    pid, arrival, burst = table.pid, table.arrival, table.burst
+    start, completion = table.start, table.completion
+    order = sorted(range(len(table)), key=lambda i: (arrival[i], pid[i]))
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("rows_sorted", len(order))
+    time, gantt = 0, []
+    for i in order:
+        if time < arrival[i]:
+            time = arrival[i]
+        start[i], completion[i] = time, time + burst[i]
+        gantt.append((pid[i], start[i], completion[i]))
+        time = completion[i]
+    return order, gantt
+
+
+# Vectorized FCFS. With jobs in (arrival, PID) order the recurrence
+# C[k] = max(C[k-1], A[k]) + B[k] unrolls to
+# C[k] = S[k] + max(0, max_{j<=k}(A[j] - S[j-1])), where S is the running
+# burst sum, so it is one cumsum plus one maximum.accumulate. The identity
+# only holds exactly in integer arithmetic: with floats the rounding of the
+# running sum lets a start drift below the previous completion, so float
+# tables take the sequential path.
+def _fcfs_numpy(table: ProcessTable):
+    pid, arrival, burst = (np.asarray(c) for c in (table.pid, table.arrival, table.burst))
+    # Traces usually come sorted by arrival already; skip the sort if so
+    step = np.diff(arrival)
+    if ((step > 0) | ((step == 0) & (np.diff(pid) >= 0))).all():
+        order = np.arange(len(table))
+    else:
+        order = np.lexsort((pid, arrival))
+        if Instrumentation.profiler is not None:
+            Instrumentation.count("rows_sorted", len(order))
+    a, b = arrival[order], burst[order]
+    total = np.cumsum(b)
+    offset = np.maximum.accumulate(a - (total - b))
+    np.maximum(offset, 0, out=offset)
+    completion = total + offset
+    start = completion - b
+
+    np.asarray(table.start)[order] = start
+    np.asarray(table.completion)[order] = completion
+    return order, GanttColumns(pid[order], start, completion)
+
+
+# Shared engine for the non-preemptive policies (SJF, Priority).
+# Processes are sorted by arrival once and admitted into a ready heap as
+# time passes, so each dispatch is a heap pop instead of a full rescan.
+# The input index is the final tie-breaker, which mirrors min() picking the
+# first of several equal candidates.
+def _run_nonpreemptive(table: ProcessTable, key):
+    pid, arrival, burst = table.pid, table.arrival, table.burst
+    start, completion = table.start, table.completion
+    order = sorted(range(len(table)), key=arrival.__getitem__)
+    time, nxt, gantt, ready = 0, 0, [], []
+
+    while nxt < len(order) or ready:
+        # Admit everything that has arrived by now
+        while nxt < len(order) and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (key(i), i))
+            nxt += 1
+
+        if not ready:
+            # CPU is idle: jump to the next arrival
+            time = arrival[order[nxt]]
             continue
 
-        p = min(available, key=lambda x: x['BurstTime'])
+        i = heapq.heappop(ready)[1]
+        start[i], completion[i] = time, time + burst[i]
+        gantt.append((pid[i], start[i], completion[i]))
+        time = completion[i]
 
-        p['StartTime'], p['CompletionTime'] = time, time + p['BurstTime']
-        p['TurnaroundTime'] = p['CompletionTime'] - p['ArrivalTime']
-        p['WaitingTime'] = p['TurnaroundTime'] - p['BurstTime']
-        gantt.append((p['PID'], p['StartTime'], p['CompletionTime']))
-        time, done = p['CompletionTime'], done + 1
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("heap_push", len(order))
+        Instrumentation.count("heap_pop", len(order))
+    return gantt
 
-    return list(procs_dict.values()), calculate_metrics(list(procs_dict.values())), gantt
 
+# SJF (non-preemptive)
+def sjf(processes: Union[List[Dict], ProcessTable]):
+    table = _as_table(processes)
+    with Instrumentation.phase("schedule"):
+        gantt = _run_nonpreemptive(table, key=table.burst.__getitem__)
+    return _results(processes, table, gantt)
 
-# SRTF (preemptive SJF)
-def srtf(processes: List[Dict]):
-    procs = [p.copy() for p in processes]
-    for p in procs:
-        p['RemainingTime'] = p['BurstTime']
-
-    time, done, gantt = 0, 0, []
-
-    while done < len(procs):
-        available = [p for p in procs if p['ArrivalTime'] <= time and p['RemainingTime'] > 0]
 
-        if not available:
-            remaining = [p for p in procs if p['RemainingTime'] > 0]
-            if not remaining:
-                break
-            time = min(p['ArrivalTime'] for p in remaining)
+# SRTF (preemptive SJF)
+# Event driven: time only stops at arrivals and completions, and the ready
+# heap is keyed by (remaining time, input index). Between two events the
+# running process can only get shorter, so nothing else can preempt it.
+def srtf(processes: Union[List[Dict], ProcessTable]):
+    table = _as_table(processes)
+    with Instrumentation.phase("schedule"):
+        gantt = _run_srtf(table)
+    return _results(processes, table, gantt)
+
+
+def _run_srtf(table: ProcessTable):
+    pid, arrival = table.pid, table.arrival
+    start, completion, unset = table.start, table.completion, table.unset
+    rem = table.remaining = array(table.time_type, table.burst)
+
+    # Zero-length jobs never need the CPU and are never completed
+    order = sorted((i for i in range(len(table)) if rem[i] > 0), key=arrival.__getitem__)
+    time, nxt, gantt, ready = 0, 0, [], []
+    repushes = 0
+
+    while nxt < len(order) or ready:
+        while nxt < len(order) and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (rem[i], i))
+            nxt += 1
+
+        if not ready:
+            time = arrival[order[nxt]]
             continue
 
-        p = min(available, key=lambda x: x['RemainingTime'])
+        remaining, i = heapq.heappop(ready)
+        if start[i] == unset:
+            start[i] = time
 
-        if p.get('StartTime') is None:
-            p['StartTime'] = time
-
-        p['RemainingTime'] -= 1
-        time += 1
-
-        if not gantt or gantt[-1][0] != p['PID']:
-            gantt.append([p['PID'], time - 1, time])
+        # Run until it finishes or the next arrival, whichever is first
+        next_arrival = arrival[order[nxt]] if nxt < len(order) else None
+        if next_arrival is None or time + remaining <= next_arrival:
+            end = time + remaining
+            rem[i] = 0
+            completion[i] = end
         else:
-            gantt[-1][2] = time
+            end = next_arrival
+            rem[i] = remaining - (end - time)
+            heapq.heappush(ready, (rem[i], i))
+            repushes += 1
 
-        if p['RemainingTime'] == 0:
-            p['CompletionTime'] = time
-            p['TurnaroundTime'] = time - p['ArrivalTime']
-            p['WaitingTime'] = p['TurnaroundTime'] - p['BurstTime']
-            done += 1
+        if gantt and gantt[-1][0] == pid[i] and gantt[-1][2] == time:
+            gantt[-1][2] = end
+        else:
+            gantt.append([pid[i], time, end])
+        time = end
 
-    gantt_tuples = [(pid, start, end) for pid, start, end in gantt]
-    return procs, calculate_metrics(procs), gantt_tuples
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("heap_push", len(order) + repushes)
+        Instrumentation.count("heap_pop", len(order) + repushes)
+    return [(pid, start, end) for pid, start, end in gantt]
 
 
 # Priority Scheduling (non-preemptive)
-def priority_scheduling(processes: List[Dict]):
-    procs = [p.copy() for p in processes]
-    time, done, gantt = 0, 0, []
-    procs_dict = {p['PID']: p for p in procs}
-
-    while done < len(procs):
-        available = [p for p in procs if p.get('StartTime') is None and p['ArrivalTime'] <= time]
-
-        if not available:
-            unstarted = [p for p in procs if p.get('StartTime') is None]
-            if not unstarted:
-                break
-            time = min(p['ArrivalTime'] for p in unstarted)
-            continue
-
-        p = min(available, key=lambda x: (x['Priority'], x['ArrivalTime']))
-
-        p['StartTime'], p['CompletionTime'] = time, time + p['BurstTime']
-        p['TurnaroundTime'] = p['CompletionTime'] - p['ArrivalTime']
-        p['WaitingTime'] = p['TurnaroundTime'] - p['BurstTime']
-        gantt.append((p['PID'], p['StartTime'], p['CompletionTime']))
-        time, done = p['CompletionTime'], done + 1
-
-    return list(procs_dict.values()), calculate_metrics(list(procs_dict.values())), gantt
\ No newline at end of file
+def priority_scheduling(processes: Union[List[Dict], ProcessTable]):
+    table = _as_table(processes)
+    priority, arrival = table.priority, table.arrival
+    with Instrumentation.phase("schedule"):
+        gantt = _run_nonpreemptive(table, key=lambda i: (priority[i], arrival[i]))
+    return _results(processes, table, gantt)
+
+
+# --- Time-sliced policies ---
+# Ready queues are deques and arrivals are admitted through a pointer into the
+# arrival-sorted order, so every dispatch, preemption and requeue is O(1)
+# (O(levels) for the multi-queue policies) instead of a rescan of all processes.
+
+def _append_slice(gantt, pid, start, end):
+    # Merge a slice into the previous one when the same process just kept running
+    if gantt and gantt[-1][0] == pid and gantt[-1][2] == start:
+        gantt[-1][2] = end
+    else:
+        gantt.append([pid, start, end])
+
+
+# Engine shared by Round Robin and MLFQ. quanta[l] is the time slice at level l;
+# a process that uses up its slice drops one level (the last level just
+# round-robins), a process preempted by a higher level keeps its place and
+# what is left of its slice. New arrivals enter level 0. With boost set, every
+# `boost` time units all processes move back to level 0 with a fresh slice.
+def _run_time_sliced(table: ProcessTable, quanta, boost=None):
+    pid, arrival = table.pid, table.arrival
+    start, completion, unset = table.start, table.completion, table.unset
+    rem = table.remaining = array(table.time_type, table.burst)
+    n_levels = len(quanta)
+
+    order = sorted((i for i in range(len(table)) if rem[i] > 0), key=arrival.__getitem__)
+    queues = [deque() for _ in range(n_levels)]
+    level = [0] * len(table)
+    used = [0] * len(table)
+    time, nxt, gantt, waiting = 0, 0, [], 0
+    running = None
+    next_boost = boost
+    dispatches = requeues = boosts = 0
+
+    while nxt < len(order) or waiting or running is not None:
+        while nxt < len(order) and arrival[order[nxt]] <= time:
+            queues[0].append(order[nxt])
+            waiting += 1
+            nxt += 1
+
+        if next_boost is not None and time >= next_boost:
+            for q in queues[1:]:
+                queues[0].extend(q)
+                q.clear()
+            for i in queues[0]:
+                level[i] = used[i] = 0
+            if running is not None:
+                level[running] = used[running] = 0
+            while next_boost <= time:
+                next_boost += boost
+            boosts += 1
+
+        if running is not None and level[running] > 0:
+            # A process waiting on a higher level takes the CPU back
+            if any(queues[l] for l in range(level[running])):
+                queues[level[running]].appendleft(running)
+                waiting += 1
+                running = None
+
+        if running is None:
+            if not waiting:
+                time = arrival[order[nxt]]
+                continue
+            running = next(q for q in queues if q).popleft()
+            waiting -= 1
+            dispatches += 1
+            if start[running] == unset:
+                start[running] = time
+
+        i, lvl = running, level[running]
+        left = quanta[lvl] - used[i]
+        run = min(rem[i], left)
+        # Only an arrival can preempt a process below level 0
+        if lvl > 0 and nxt < len(order) and arrival[order[nxt]] - time < run:
+            run = arrival[order[nxt]] - time
+        if next_boost is not None and next_boost - time < run:
+            run = next_boost - time
+        end = time + run
+
+        _append_slice(gantt, pid[i], time, end)
+        # Settled from run itself: with float times, (time + run) - time can
+        # miss run by a rounding error and leave a sliver that never reaches 0
+        rem[i] = 0 if run == rem[i] else rem[i] - run
+        used[i] = quanta[lvl] if run == left else used[i] + run
+        time = end
+
+        if rem[i] == 0:
+            completion[i] = time
+            running = None
+        elif used[i] >= quanta[lvl]:
+            # Slice used up: requeue behind everything that arrived meanwhile
+            while nxt < len(order) and arrival[order[nxt]] <= time:
+                queues[0].append(order[nxt])
+                waiting += 1
+                nxt += 1
+            level[i] = min(lvl + 1, n_levels - 1)
+            used[i] = 0
+            queues[level[i]].append(i)
+            waiting += 1
+            requeues += 1
+            running = None
+
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("dispatches", dispatches)
+        Instrumentation.count("quantum_expiries", requeues)
+        Instrumentation.count("boosts", boosts)
+    return [(p, s, e) for p, s, e in gantt]
+
+
+# Round Robin
+def round_robin(processes: Union[List[Dict], ProcessTable], quantum=2):
+    if quantum <= 0:
+        raise ValueError("quantum must be positive")
+    table = _as_table(processes, quantum)
+    with Instrumentation.phase("schedule"):
+        gantt = _run_time_sliced(table, [quantum])
+    return _results(processes, table, gantt)
+
+
+# Multilevel Feedback Queue: `levels` queues, level l running with time slice
+# quanta[l] (default 2, 4, 8, ...), optional periodic priority boost
+def mlfq(processes: Union[List[Dict], ProcessTable], levels=3, quanta=None, boost=None):
+    quanta = list(quanta) if quanta is not None else [2 << l for l in range(levels)]
+    if len(quanta) != levels or levels <= 0:
+        raise ValueError("need one quantum per level")
+    if any(q <= 0 for q in quanta) or (boost is not None and boost <= 0):
+        raise ValueError("quanta and boost must be positive")
+    table = _as_table(processes, boost, *quanta)
+    with Instrumentation.phase("schedule"):
+        gantt = _run_time_sliced(table, quanta, boost)
+    return _results(processes, table, gantt)
+
+
+# Priority Scheduling (preemptive) with aging. Lower number = higher priority.
+# Distinct priorities are compressed to levels 0 (best) .. L-1, and a process
+# that has waited `aging` time units on a level moves up to the next better
+# one, behind whatever is already waiting there. A preempted process goes
+# back to its own priority. aging=None turns aging off (plain preemptive priority).
+#
+# Aging is not applied by sweeping the levels: a process queued at time e on
+# level b is on level max(0, b - (t - e) // aging) at time t, and entered that
+# level at e + (b - level) * aging. Ordering the waiting processes by
+# e + b * aging, the time they would reach level 0, therefore orders them by
+# level and then by entry into the level at every t at once, so a single heap
+# serves all levels and each event costs O(log n) whatever the number of
+# distinct priorities.
+def preemptive_priority(processes: Union[List[Dict], ProcessTable], aging=10):
+    if aging is not None and aging <= 0:
+        raise ValueError("aging must be positive")
+    table = _as_table(processes, aging)
+    with Instrumentation.phase("schedule"):
+        gantt = _run_preemptive_priority(table, aging)
+    return _results(processes, table, gantt)
+
+
+def _run_preemptive_priority(table: ProcessTable, aging):
+    pid, arrival, priority = table.pid, table.arrival, table.priority
+    start, completion, unset = table.start, table.completion, table.unset
+    rem = table.remaining = array(table.time_type, table.burst)
+
+    order = sorted((i for i in range(len(table)) if rem[i] > 0), key=arrival.__getitem__)
+    base = {p: l for l, p in enumerate(sorted(set(priority[i] for i in order)))}
+    # Entries are (key, kind, tie, seq, base level, queued at, index). Among
+    # equal keys a level's queue holds arrivals first (better base level
+    # first, as they got there without waiting), then processes promoted into
+    # it, then a process preempted at that instant: kind and tie encode that.
+    ready = []
+    time, nxt, gantt, seq = 0, 0, [], 0
+    running, running_level = None, None
+    dispatches = promotions = 0
+
+    def enqueue(i, queued, preempted):
+        nonlocal seq
+        seq += 1
+        b = base[priority[i]]
+        if aging is None:
+            heapq.heappush(ready, (b, 0, 0, seq, b, queued, i))
+        else:
+            heapq.heappush(ready, (queued + b * aging, preempted, -b if preempted else b, seq, b, queued, i))
+
+    def level(entry):
+        b, queued = entry[4], entry[5]
+        if aging is None:
+            return b
+        steps = min(b, int((time - queued) // aging))
+        # Settle on the promotion times queued + k * aging that runs are cut
+        # at below, which float division can put one step off
+        if steps < b and queued + (steps + 1) * aging <= time:
+            steps += 1
+        elif steps > 0 and queued + steps * aging > time:
+            steps -= 1
+        return b - steps
+
+    while nxt < len(order) or ready or running is not None:
+        while nxt < len(order) and arrival[order[nxt]] <= time:
+            enqueue(order[nxt], arrival[order[nxt]], 0)
+            nxt += 1
+
+        best = level(ready[0]) if ready else None
+        if running is not None and best is not None and best < running_level:
+            enqueue(running, time, 1)
+            running = None
+
+        if running is None:
+            if not ready:
+                time = arrival[order[nxt]]
+                continue
+            entry = heapq.heappop(ready)
+            running, running_level = entry[6], best
+            promotions += entry[4] - best
+            dispatches += 1
+            if start[running] == unset:
+                start[running] = time
+
+        # Run until completion, the next arrival, or the moment the best
+        # waiting process ages past the running one's level
+        i = running
+        run = rem[i]
+        if nxt < len(order) and arrival[order[nxt]] - time < run:
+            run = arrival[order[nxt]] - time
+        if aging is not None and ready and running_level > 0:
+            b, queued = ready[0][4], ready[0][5]
+            overtakes = queued + (b - running_level + 1) * aging
+            if overtakes - time < run:
+                run = overtakes - time
+        end = time + run
+
+        _append_slice(gantt, pid[i], time, end)
+        rem[i] = 0 if run == rem[i] else rem[i] - run
+        time = end
+        if rem[i] == 0:
+            completion[i] = time
+            running = None
+
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("dispatches", dispatches)
+        Instrumentation.count("promotions", promotions)
+    return [(p, s, e) for p, s, e in gantt]
+
+
+# --- Multi-core (SMP) scheduling ---
+
+# Ready-queue order per policy; the input index breaks ties
+SMP_POLICIES = {
+    "fcfs": lambda t, i: (t.arrival[i], i),
+    "sjf": lambda t, i: (t.burst[i], i),
+    "priority": lambda t, i: (t.priority[i], t.arrival[i], i),
+    "rr": None,  # FIFO in order of (re)queueing
+}
+
+
+# N cores sharing one clock. dispatch="global" has every core pull from one
+# shared ready queue; dispatch="per-core" gives each core its own queue, puts
+# each arrival on the least loaded core (fewest queued + running) and, with
+# steal=True, lets an idle core with nothing queued take the best process
+# from the core with the longest queue. With a quantum, a process gives up its
+# core after that long and is requeued on the same core (default 2 for "rr",
+# run-to-completion otherwise).
+#
+# Returns (procs, metrics, lanes) with one Gantt lane per core; the metrics
+# add per-core utilisation, load imbalance and the number of steals.
+def smp_schedule(processes: Union[List[Dict], ProcessTable], cores=2, policy="fcfs",
+                 dispatch="per-core", steal=True, quantum=None):
+    if cores <= 0:
+        raise ValueError("cores must be positive")
+    if policy not in SMP_POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {sorted(SMP_POLICIES)}")
+    if dispatch not in ("global", "per-core"):
+        raise ValueError("dispatch must be 'global' or 'per-core'")
+    if policy == "rr" and quantum is None:
+        quantum = 2
+    if quantum is not None and quantum <= 0:
+        raise ValueError("quantum must be positive")
+
+    table = _as_table(processes, quantum)
+    with Instrumentation.phase("schedule"):
+        lanes, steals = _run_smp(table, cores, SMP_POLICIES[policy], dispatch == "global", steal, quantum)
+    with Instrumentation.phase("metrics"):
+        metrics = calculate_metrics(table, lanes=lanes)
+    metrics["steals"] = steals
+    if Instrumentation.profiler is not None:
+        Instrumentation.count("processes", len(table))
+        Instrumentation.count("gantt_segments", sum(len(lane) for lane in lanes))
+        Instrumentation.count("context_switches", metrics["context_switches"])
+        Instrumentation.count("steals", steals)
+    if isinstance(processes, ProcessTable):
+        return table, metrics, lanes
+    return table.to_dicts(), metrics, lanes
+
+
+def _run_smp(table: ProcessTable, cores, key, shared, steal, quantum):
+    pid, arrival = table.pid, table.arrival
+    start, completion, unset = table.start, table.completion, table.unset
+    rem = table.remaining = array(table.time_type, table.burst)
+
+    order = sorted((i for i in range(len(table)) if rem[i] > 0), key=arrival.__getitem__)
+    queues = [[] for _ in range(1 if shared else cores)]  # heaps of (key, seq, index)
+    running = [None] * cores
+    busy = []  # heap of (slice end, core)
+    lanes = [[] for _ in range(cores)]
+    time, nxt, seq, steals, dispatches = 0, 0, 0, 0, 0
+
+    def enqueue(q, i):
+        nonlocal seq
+        seq += 1
+        heapq.heappush(queues[q], (key(table, i) if key else (), seq, i))
+
+    while nxt < len(order) or busy or any(queues):
+        # Jump to the next event: a slice ending or an arrival
+        time = busy[0][0] if busy else arrival[order[nxt]]
+        if nxt < len(order) and arrival[order[nxt]] < time:
+            time = arrival[order[nxt]]
+
+        preempted = []
+        while busy and busy[0][0] <= time:
+            c = heapq.heappop(busy)[1]
+            i, running[c] = running[c], None
+            if rem[i] == 0:
+                completion[i] = time
+            else:
+                preempted.append((c, i))
+
+        while nxt < len(order) and arrival[order[nxt]] <= time:
+            if shared:
+                enqueue(0, order[nxt])
+            else:
+                load = [len(queues[c]) + (running[c] is not None) for c in range(cores)]
+                enqueue(load.index(min(load)), order[nxt])
+            nxt += 1
+        # Time-sliced processes go behind this instant's arrivals, on their own core
+        for c, i in preempted:
+            enqueue(0 if shared else c, i)
+
+        for c in range(cores):
+            if running[c] is not None:
+                continue
+            q = 0 if shared else c
+            if not queues[q] and steal and not shared:
+                victim = max(range(cores), key=lambda v: len(queues[v]))
+                if queues[victim]:
+                    q = victim
+                    steals += 1
+            if not queues[q]:
+                continue
+            i = heapq.heappop(queues[q])[2]
+            if start[i] == unset:
+                start[i] = time
+            run = rem[i] if quantum is None or rem[i] <= quantum else quantum
+            rem[i] -= run
+            running[c] = i
+            dispatches += 1
+            heapq.heappush(busy, (time + run, c))
+            _append_slice(lanes[c], pid[i], time, time + run)
+
+    if Instrumentation.profiler is not None:
+        # Run queues see one push per enqueue and one pop per dispatch; the
+        # busy heap one push and one pop per dispatched slice
+        Instrumentation.count("dispatches", dispatches)
+        Instrumentation.count("heap_push", seq + dispatches)
+        Instrumentation.count("heap_pop", 2 * dispatches)
+    return [[(p, s, e) for p, s, e in lane] for lane in lanes], steals
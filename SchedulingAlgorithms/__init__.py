@@ -0,0 +1,3 @@
+# CPU scheduling algorithms (Scheduling) and their comparison / plotting
+# front end (data). Import from the repository root, e.g.
+#   from SchedulingAlgorithms.Scheduling import fcfs, ProcessTable
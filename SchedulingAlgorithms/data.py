@@ -1,15 +1,33 @@
+import os
 import random
 import json
-import matplotlib.pyplot as plt # <-- UNCOMMENTED FOR PLOTTING
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict
 
-# *** THIS IS THE NEW IMPORT PATH ***
-# Ensure this works based on your directory structure (e.g., from Algorithms.Scheduling import ...)
-from Scheduling import fcfs, sjf, srtf, priority_scheduling
+if __package__ in (None, ""):
+    # Run as a script (python SchedulingAlgorithms/data.py): make the repository
+    # root importable so the package import below resolves
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SchedulingAlgorithms.Scheduling import (fcfs, sjf, srtf, priority_scheduling, round_robin, preemptive_priority,
+                        mlfq, smp_schedule, SMP_POLICIES, ProcessTable, GanttColumns)
+from Instrumentation import set_profiler
 
 # Helper function (Assuming calculate_metrics is available in the imported Scheduling module)
 # If calculate_metrics is NOT imported, you must add it to the import list above.
 
+# Algorithms compared by compare_algorithms and run_comparison, by display name
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "SJF": sjf,
+    "SRTF": srtf,
+    "Priority": priority_scheduling,
+    "RR": round_robin,
+    "Priority-P": preemptive_priority,
+    "MLFQ": mlfq
+}
+
 # Pretty print function (Kept for CLI output)
 def format_results(name, results, metrics, gantt):
     """Prints the results in a formatted table."""
@@ -17,9 +35,10 @@ def format_results(name, results, metrics, gantt):
     print("PID Arrival Burst Priority Start Completion Turnaround Waiting")
     print("-" * 75)
 
-    results.sort(key=lambda x: x['PID'])
-
-    for p in results:
+    # Columnar results are turned back into rows only for printing
+    if isinstance(results, ProcessTable):
+        results = results.to_dicts()
+    for p in sorted(results, key=lambda x: x['PID']):
         start_time = p.get('StartTime', '-')
         completion_time = p.get('CompletionTime', '-')
         turnaround_time = p.get('TurnaroundTime', '-')
@@ -31,8 +50,9 @@ def format_results(name, results, metrics, gantt):
 
     print("-" * 75)
     print("Metrics:")
-    print("Avg Waiting Time={:.2f} Avg Turnaround Time={:.2f} Throughput={:.2f}".format(
-        metrics['average_waiting_time'], metrics['average_turnaround_time'], metrics['throughput']))
+    print("Avg Waiting Time={:.2f} Avg Turnaround Time={:.2f} Throughput={:.2f} Context Switches={}".format(
+        metrics['average_waiting_time'], metrics['average_turnaround_time'], metrics['throughput'],
+        metrics.get('context_switches', '-')))
     print("Gantt Chart (PID:Start->End):", " ".join([f"P{pid}:{s}->{e}" for pid, s, e in gantt]))
 
 
@@ -51,14 +71,147 @@ def generate_processes(n=5, max_arrival=10, max_burst=10, max_priority=5):
     return processes
 
 
+def _validate_process(row):
+    """Return why a process row is malformed, or None if it is fine."""
+    if not isinstance(row, dict):
+        return "expected a JSON object"
+    for key in ("PID", "ArrivalTime", "BurstTime"):
+        if key not in row:
+            return f"missing field '{key}'"
+    if not isinstance(row["PID"], int) or isinstance(row["PID"], bool):
+        return "PID must be an integer"
+    for key in ("ArrivalTime", "BurstTime"):
+        value = row[key]
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value != value:
+            return f"{key} must be a number"
+    if row["ArrivalTime"] < 0:
+        return "ArrivalTime must not be negative"
+    if row["BurstTime"] <= 0:
+        return "BurstTime must be positive"
+    if "Priority" in row and (not isinstance(row["Priority"], int) or isinstance(row["Priority"], bool)):
+        return "Priority must be an integer"
+    return None
+
+
+def _iter_json_lines(f):
+    """Yield (row_number, value or exception) for each non-blank JSON Lines record."""
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, e
+
+
+def _iter_json_array(f, chunk_size, max_element=1 << 20):
+    """Yield (row_number, value or exception) for each element of a top-level
+    JSON array, reading the file in chunks so only one element is decoded at a
+    time. A syntax error, an element longer than max_element characters or a
+    missing closing bracket is yielded once, with its byte offset, and ends
+    the scan: without a parseable element boundary there is no safe place to
+    resume."""
+    decoder = json.JSONDecoder()
+    encoding = getattr(f, "encoding", None) or "utf-8"
+    buf, eof = f.read(chunk_size), False
+    pos = buf.index("[") + 1
+    consumed = 0  # bytes of the file before buf[0]
+    row = 0
+
+    def refill():
+        # Drop what has been decoded and append the next chunk. Only the
+        # unfinished element is carried over, and max_element bounds it
+        nonlocal buf, pos, eof, consumed
+        consumed += len(buf[:pos].encode(encoding))
+        chunk = f.read(chunk_size)
+        buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    def error(message, at):
+        return json.JSONDecodeError(f"{message} at byte offset {consumed + len(buf[:at].encode(encoding))}", "", 0)
+
+    while True:
+        # Skip whitespace and separators, pulling in more text when needed
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ","):
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            refill()
+        if pos >= len(buf):
+            yield row + 1, error("unexpected end of file inside JSON array", pos)
+            return
+        if buf[pos] == "]":
+            return
+
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            # More text can only help if decoding ran into the end of the
+            # buffer: an unterminated string, or a failure in the last few
+            # characters (a cut-off literal such as "tr" or a \u escape)
+            truncated = e.msg.startswith("Unterminated string") or e.pos >= len(buf) - 6
+            if eof or not truncated:
+                yield row + 1, error(e.msg, e.pos)
+                return
+            end = None
+        if end is None or (end == len(buf) and not eof):
+            # The value may be incomplete: read on, within reason
+            if len(buf) - pos > max_element:
+                yield row + 1, error(f"element longer than {max_element} characters", pos)
+                return
+            refill()
+            continue
+
+        row += 1
+        yield row, value
+        pos = end
+
+
+def iter_processes_from_file(filename, errors=None, chunk_size=1 << 16):
+    """Lazily yield validated processes from a JSON array or JSON Lines file.
+
+    Malformed rows are appended to `errors` as (row_number, message) when a
+    list is given; otherwise the first one raises ValueError.
+    """
+    with open(filename, "r") as f:
+        head = f.read(chunk_size)
+        stripped = head.lstrip()
+        f.seek(0)
+        if stripped.startswith("["):
+            rows = _iter_json_array(f, chunk_size)
+        else:
+            rows = _iter_json_lines(f)
+
+        for row_number, row in rows:
+            if isinstance(row, Exception):
+                message = f"invalid JSON ({row.msg})"
+            else:
+                message = _validate_process(row)
+            if message is None:
+                yield row
+            elif errors is not None:
+                errors.append((row_number, message))
+            else:
+                raise ValueError(f"{filename}: row {row_number}: {message}")
+
+
 def load_processes_from_file(filename):
-    """Load processes from a JSON file"""
-    try:
-        with open(filename, "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        print(f"Error: Could not load/decode file '{filename}'. Generating random processes instead.")
-        return generate_processes(n=4)
+    """Load processes from a JSON array or JSON Lines file, reporting malformed rows"""
+    errors = []
+    processes = list(iter_processes_from_file(filename, errors))
+    for row_number, message in errors:
+        print(f"Warning: skipping row {row_number} of '{filename}': {message}")
+    return processes
+
+
+def load_process_table(filename, errors=None, rows_per_chunk=1 << 16):
+    """Stream a trace file straight into a columnar ProcessTable.
+
+    Parsed rows go into the typed columns rows_per_chunk at a time, so at most
+    one chunk of per-process dicts is alive and memory stays proportional to
+    the columns plus that chunk.
+    """
+    return ProcessTable.from_rows(iter_processes_from_file(filename, errors), chunk_size=rows_per_chunk)
 
 
 def input_processes():
@@ -88,66 +241,93 @@ def input_processes():
 # PLOTTING FUNCTIONS GO HERE
 # -------------------------
 
-def plot_gantt(gantt, title):
-    """Generates and displays the Gantt chart for a single scheduling run."""
-    import matplotlib.pyplot as plt # Import locally for safety
+# matplotlib is only imported by the functions below, so runs that never plot
+# don't pay for it. With a save_path the figure is rendered straight to that
+# file (format from the extension: .png, .svg, .pdf, ...) without pyplot or a GUI.
+def _new_figure(save_path, **kwargs):
+    if save_path:
+        from matplotlib.figure import Figure
+        return Figure(**kwargs)
+    import matplotlib.pyplot as plt
+    return plt.figure(**kwargs)
 
-    fig, ax = plt.subplots(figsize=(10, 3))
 
-    max_time = max(end for pid, start, end in gantt) if gantt else 0
+def _show_or_save(fig, save_path, dpi=None):
+    if save_path:
+        fig.savefig(save_path, dpi=dpi)
+    else:
+        import matplotlib.pyplot as plt
+        plt.show()
+
 
-    pids = sorted(list(set(p[0] for p in gantt)))
-    pid_to_color = {pid: plt.cm.get_cmap('viridis')(i / (len(pids) + 1)) for i, pid in enumerate(pids)}
+def _downsample(segments, max_segments):
+    """Merges a lane's (pid, start, end) segments into at most max_segments bars.
 
-    for pid, start, end in gantt:
-        color = pid_to_color[pid]
-        ax.barh(y=0, width=end - start, left=start, height=0.5, color=color)
-        ax.text((start + end) / 2, 0, f"P{pid}", ha="center", va="center", color="white", fontweight='bold')
+    The lane's time range is cut into max_segments equal buckets; each bucket
+    becomes one bar from its first start to its last end, coloured by the
+    process that ran longest in it. At that density a bucket is narrower than
+    a pixel, so the chart looks the same.
+    """
+    import numpy as np
+    if isinstance(segments, GanttColumns):
+        pid, start, end = segments.pid, segments.start, segments.end
+    else:
+        pid, start, end = (np.asarray(c) for c in zip(*segments))
+    width = (end.max() - start.min()) / max_segments
+    bucket = ((start - start.min()) / width).astype(np.int64) if width > 0 else np.zeros(len(start), np.int64)
+    first = np.flatnonzero(np.diff(bucket, prepend=-1))  # segments are in time order
+    # Longest segment per bucket: sort by (bucket, duration), take each bucket's last
+    longest = np.lexsort((end - start, bucket))[np.append(first[1:], len(bucket)) - 1]
+    return list(zip(pid[longest].tolist(), start[first].tolist(),
+                    np.maximum.reduceat(end, first).tolist()))
+
+
+def plot_gantt(gantt, title, save_path=None, max_segments=10000, dpi=None):
+    """Draws the Gantt chart for a single scheduling run, shown or saved to save_path.
+
+    gantt is the (pid, start, end) list of a scheduler or the per-core lanes of
+    smp_schedule. Each lane is a single broken_barh call; lanes with more than
+    max_segments segments are downsampled first, and segment labels are only
+    drawn while they fit.
+    """
+    import matplotlib
+
+    lanes = gantt if gantt and all(isinstance(lane, list) for lane in gantt) else [gantt]
+    lanes = [_downsample(lane, max_segments) if len(lane) > max_segments else lane for lane in lanes]
+    fig = _new_figure(save_path, figsize=(10, 2 + len(lanes)))
+    ax = fig.subplots()
+
+    pids = sorted(set(seg[0] for lane in lanes for seg in lane))
+    cmap = matplotlib.colormaps['viridis']
+    pid_to_color = {pid: cmap(i / (len(pids) + 1)) for i, pid in enumerate(pids)}
+    max_time = max((lane[-1][2] for lane in lanes if lane), default=0)
+
+    for y, lane in enumerate(lanes):
+        ax.broken_barh([(start, end - start) for _, start, end in lane], (y - 0.25, 0.5),
+                       facecolors=[pid_to_color[pid] for pid, _, _ in lane])
+        if len(lane) <= 50:
+            for pid, start, end in lane:
+                ax.text((start + end) / 2, y, f"P{pid}", ha="center", va="center",
+                        color="white", fontweight='bold')
 
     ax.set_title(title, pad=15)
     ax.set_xlabel("Time")
-    ax.set_xticks(range(int(max_time) + 1))
-    ax.set_yticks([])
+    if max_time <= 50:
+        ax.set_xticks(range(int(max_time) + 1))
+    if len(lanes) > 1:
+        ax.set_yticks(range(len(lanes)))
+        ax.set_yticklabels([f"CPU {c}" for c in range(len(lanes))])
+    else:
+        ax.set_yticks([])
     ax.grid(axis='x', linestyle='--')
-    plt.tight_layout()
-    plt.show()
-
+    fig.tight_layout()
+    _show_or_save(fig, save_path, dpi)
 
-def compare_algorithms(processes): # <-- REPLACING THE OLD CLI-ONLY FUNCTION
-    """Compares all algorithms, prints results, and plots Gantt/Comparison charts."""
-    # Note: If matplotlib fails, this function will crash.
-    # For robustness, a try/except or separating CLI logic is best.
 
-    algos = {
-        "FCFS": fcfs,
-        "SJF": sjf,
-        "SRTF": srtf,
-        "Priority": priority_scheduling
-    }
-
-    avg_waiting, avg_turnaround = {}, {}
-
-    print("\n" + "=" * 80)
-    print("Running Scheduling Algorithms and Generating Plots...")
-    print("=" * 80)
-
-    # 1. Run algorithms, print results, and plot individual Gantt charts
-    for name, fn in algos.items():
-        results, metrics, gantt = fn(processes)
-
-        # Print detailed results to CLI
-        format_results(name, results, metrics, gantt)
-
-        # Store metrics for comparison plot
-        avg_waiting[name] = metrics["average_waiting_time"]
-        avg_turnaround[name] = metrics["average_turnaround_time"]
-
-        # Show Gantt chart
-        plot_gantt(gantt, f"{name} Scheduling Gantt Chart")
-
-    # 2. Plot comparison bar charts
-    import matplotlib.pyplot as plt
-    fig, ax = plt.subplots(1, 2, figsize=(12, 5))
+def plot_comparison(avg_waiting, avg_turnaround, save_path=None):
+    """Draws the average waiting/turnaround bar charts, shown or saved to save_path."""
+    fig = _new_figure(save_path, figsize=(12, 5))
+    ax = fig.subplots(1, 2)
 
     names = list(avg_waiting.keys())
     x = range(len(names))
@@ -168,9 +348,127 @@ def compare_algorithms(processes): # <-- REPLACING THE OLD CLI-ONLY FUNCTION
     ax[1].set_ylabel("Time Units")
     ax[1].bar_label(bars2, fmt='%.2f')
 
-    plt.suptitle("Scheduling Algorithm Comparison", fontweight='bold')
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.show()
+    fig.suptitle("Scheduling Algorithm Comparison", fontweight='bold')
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
+    _show_or_save(fig, save_path)
+
+
+def compare_algorithms(processes, plot=True, save_dir=None, profiler=None, cache=None):
+    """Compares all algorithms, prints results, and plots Gantt/Comparison charts.
+
+    With plot=False nothing is drawn; with save_dir the charts are written there
+    as PNG files instead of opening windows. With a profiler (e.g.
+    Instrumentation.Profiler) every algorithm runs in its own phase and the
+    profiler's report is printed. A cache (e.g. ResultsCache.ResultsCache) is
+    passed on to run_comparison. Returns the run_comparison rows.
+    """
+    print("\n" + "=" * 80)
+    print("Running Scheduling Algorithms and Generating Plots...")
+    print("=" * 80)
+
+    # 1. Run algorithms and print results
+    if profiler is None:
+        rows = run_comparison([processes], max_workers=1, cache=cache)
+    else:
+        rows = []
+        previous = set_profiler(profiler)
+        try:
+            for name in ALGORITHMS:
+                with profiler.phase(name):
+                    rows += run_comparison([processes], algorithms=[name], max_workers=1, cache=cache)
+        finally:
+            set_profiler(previous)
+    for row in rows:
+        format_results(row["algorithm"], row["results"], row, row["gantt"])
+    if profiler is not None and hasattr(profiler, "report"):
+        print(profiler.report())
+
+    if not plot:
+        return rows
+    if save_dir:
+        os.makedirs(save_dir, exist_ok=True)
+
+    def path(name):
+        return os.path.join(save_dir, f"{name.lower()}.png") if save_dir else None
+
+    # 2. Gantt chart per algorithm, then the comparison bar charts
+    for row in rows:
+        plot_gantt(row["gantt"], f"{row['algorithm']} Scheduling Gantt Chart", path(row["algorithm"]))
+    plot_comparison({row["algorithm"]: row["average_waiting_time"] for row in rows},
+                    {row["algorithm"]: row["average_turnaround_time"] for row in rows},
+                    path("comparison"))
+    return rows
+
+
+def _run_cell(cell):
+    """Worker for run_comparison: one (workload, algorithm) pair."""
+    workload_id, name, processes, keep_results = cell
+    results, metrics, gantt = ALGORITHMS[name](processes)
+    row = {"workload": workload_id, "algorithm": name}
+    row.update(metrics)
+    row["gantt"] = gantt
+    if keep_results:
+        row["results"] = results
+    return row
+
+
+def run_comparison(workloads, algorithms=None, max_workers=None, keep_results=True, cache=None):
+    """Runs every (workload, algorithm) pair, fanned out over a process pool.
+
+    Returns one flat table: a row per pair, ordered by workload then algorithm,
+    holding the metrics, the Gantt data and (with keep_results) the per-process
+    results. max_workers=1 runs everything in this process. With a cache only
+    the pairs it does not hold yet are run.
+    """
+    names = list(algorithms or ALGORITHMS)
+    cells = [(w, name, processes, keep_results) for w, processes in enumerate(workloads) for name in names]
+
+    keys = rows = None
+    if cache is not None:
+        digests = [cache.digest(processes) for processes in workloads]
+        keys = [cache.key(name, digests[w], ALGORITHMS[name], keep_results=keep_results) for w, name, _, _ in cells]
+        rows = [cache.get(key) for key in keys]
+        missing = [k for k, row in enumerate(rows) if row is None]
+        cells = [cells[k] for k in missing]
+
+    if max_workers == 1 or len(cells) <= 1:
+        computed = [_run_cell(cell) for cell in cells]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        # Hand cells out in batches so small workloads are not dominated by IPC
+        chunksize = max(1, len(cells) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(_run_cell, cells, chunksize=chunksize))
+
+    if cache is None:
+        return computed
+    for k, row in zip(missing, computed):
+        cache.put(keys[k], row)
+        rows[k] = row
+    return rows
+
+
+def compare_core_counts(processes, core_counts=(1, 2, 4, 8), policies=None, dispatch="per-core", steal=True,
+                        cache=None):
+    """Runs each SMP policy at each core count; one row per (policy, cores)
+    with the metrics, so scaling and load balance can be read off directly.
+    With a cache, (policy, cores) pairs it already holds are not rerun."""
+    digest = cache.digest(processes) if cache is not None else None
+    rows = []
+    for policy in policies or SMP_POLICIES:
+        for cores in core_counts:
+            key = row = None
+            if cache is not None:
+                key = cache.key("smp", digest, smp_schedule, policy=policy, cores=cores, dispatch=dispatch, steal=steal)
+                row = cache.get(key)
+            if row is None:
+                _, metrics, _ = smp_schedule(processes, cores, policy, dispatch, steal)
+                row = {"policy": policy, "cores": cores, "dispatch": dispatch, "steal": steal}
+                row.update(metrics)
+                if cache is not None:
+                    cache.put(key, row)
+            rows.append(row)
+    return rows
 
 
 # Main function to handle input choice
@@ -189,7 +487,11 @@ def main():
         processes = input_processes()
     elif choice == "3":
         filename = "json"
-        processes = load_processes_from_file(filename)
+        try:
+            processes = load_processes_from_file(filename)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not load '{filename}': {e}")
+            return
     else:
         print("Invalid choice, defaulting to random processes.")
         processes = generate_processes(n=5)
@@ -202,7 +504,7 @@ def main():
     print("PID | AT | BT | PR")
     print("----|----|----|----")
     for p in sorted(processes, key=lambda x: x['ArrivalTime']):
-        print(f"{p['PID']:<3} | {p['ArrivalTime']:<2} | {p['BurstTime']:<2} | {p['Priority']:<2}")
+        print(f"{p['PID']:<3} | {p['ArrivalTime']:<2} | {p['BurstTime']:<2} | {p.get('Priority', '-'):<2}")
 
     # This will now call the plotting version
     compare_algorithms(processes)
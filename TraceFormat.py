@@ -0,0 +1,184 @@
+# Binary trace format for process, allocation and address traces.
+#
+# A trace is a fixed header, a column directory and then the columns
+# themselves, each a packed little-endian array aligned to 8 bytes:
+#
+#   header     magic b"OSTR", version u16, kind u16, rows u64, columns u32, pad
+#   directory  per column: name (16 bytes, NUL padded), typecode, pad, offset u64
+#   columns    rows values each; typecode 'b' int8, 'i' int32, 'q' int64, 'd' float64
+#
+# The reader maps the file and hands out memoryviews cast straight onto the
+# mapping, so opening a trace costs the same for 1 KB as for 1 GB: nothing is
+# parsed or copied until a value is actually read. The mapping stays alive for
+# as long as any of those views does.
+
+import mmap
+import struct
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # the writer falls back to array.array
+    np = None
+
+from SchedulingAlgorithms.Scheduling import ProcessTable
+
+MAGIC = b"OSTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQI4x")
+COLUMN = struct.Struct("<16sc7xQ")
+
+# Kind id and column names, in file order
+KINDS = {
+    "process": (1, ("pid", "arrival", "burst", "priority")),
+    "allocation": (2, ("kind", "pid", "size")),
+    "address": (3, ("address",)),
+}
+TYPECODES = ("b", "i", "q", "d")
+
+_INT32 = (-2 ** 31, 2 ** 31 - 1)
+
+
+def _pack(values, typecode=None):
+    # Typed buffer for one column: float64 if any value is a float, otherwise
+    # int32 when every value fits and int64 when not (unless typecode is given)
+    if np is not None:
+        data = np.asarray(values)
+        if typecode is None:
+            if data.dtype.kind == 'f':
+                typecode = 'd'
+            elif len(data) == 0 or (_INT32[0] <= data.min() and data.max() <= _INT32[1]):
+                typecode = 'i'
+            else:
+                typecode = 'q'
+        return typecode, np.ascontiguousarray(data, dtype=np.dtype(typecode).newbyteorder('<'))
+
+    if typecode is None:
+        values = list(values)
+        if any(isinstance(v, float) for v in values):
+            typecode = 'd'
+        elif not values or (_INT32[0] <= min(values) and max(values) <= _INT32[1]):
+            typecode = 'i'
+        else:
+            typecode = 'q'
+    data = array(typecode, values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return typecode, data
+
+
+def write_trace(path, kind, columns, typecodes=None):
+    """Writes a trace of the given kind. columns maps each of the kind's column
+    names to a sequence (list, array.array, NumPy array or memoryview)."""
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {sorted(KINDS)}, got {kind!r}")
+    kind_id, names = KINDS[kind]
+    typecodes = typecodes or {}
+    packed = [_pack(columns[name], typecodes.get(name)) for name in names]
+    rows = len(packed[0][1]) if packed else 0
+    if any(len(data) != rows for _, data in packed):
+        raise ValueError("all columns must have the same length")
+
+    offset = HEADER.size + COLUMN.size * len(names)
+    directory = []
+    for name, (typecode, data) in zip(names, packed):
+        offset += -offset % 8
+        directory.append(COLUMN.pack(name.encode(), typecode.encode(), offset))
+        offset += rows * array(typecode).itemsize
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, kind_id, rows, len(names)))
+        f.write(b"".join(directory))
+        for entry, (_, data) in zip(directory, packed):
+            f.write(b"\0" * (COLUMN.unpack(entry)[2] - f.tell()))
+            f.write(memoryview(data).cast('B'))
+
+
+def parse_trace(buffer):
+    """(kind, {name: memoryview}) for a trace already in memory or mapped."""
+    if sys.byteorder != "little":
+        raise NotImplementedError("zero-copy traces need a little-endian host")
+    if len(buffer) < HEADER.size:
+        raise ValueError("not a trace file: too short")
+    magic, version, kind_id, rows, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("not a trace file: bad magic")
+    if version != VERSION:
+        raise ValueError(f"unsupported trace version {version}")
+    kind = next((name for name, (i, _) in KINDS.items() if i == kind_id), None)
+    if kind is None:
+        raise ValueError(f"unknown trace kind {kind_id}")
+    if HEADER.size + count * COLUMN.size > len(buffer):
+        raise ValueError("truncated trace file")
+
+    columns = {}
+    with memoryview(buffer) as view:
+        try:
+            for k in range(count):
+                name, typecode, offset = COLUMN.unpack_from(buffer, HEADER.size + k * COLUMN.size)
+                typecode = typecode.decode()
+                if typecode not in TYPECODES:
+                    raise ValueError(f"unsupported column type {typecode!r}")
+                end = offset + rows * array(typecode).itemsize
+                if end > len(buffer):
+                    raise ValueError("truncated trace file")
+                columns[name.rstrip(b"\0").decode()] = view[offset:end].cast(typecode)
+        except Exception:
+            # Drop the views taken so far, or a mapped buffer could not be closed
+            for column in columns.values():
+                column.release()
+            raise
+    return kind, columns
+
+
+def read_trace(path):
+    """Maps a trace file read-only; returns (kind, {name: memoryview})."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return parse_trace(mapped)
+
+
+def _expect(path, kind):
+    found, columns = read_trace(path)
+    if found != kind:
+        raise ValueError(f"{path}: expected {kind} trace, found {found}")
+    return columns
+
+
+# --- Per-kind helpers ---
+
+def write_process_trace(path, table):
+    # table: a ProcessTable, e.g. from generate_process_table or load_process_table
+    if isinstance(table.pid, list) or isinstance(table.priority, list):
+        raise ValueError("binary traces hold numeric PIDs and priorities only")
+    write_trace(path, "process", {"pid": table.pid, "arrival": table.arrival,
+                                  "burst": table.burst, "priority": table.priority})
+
+
+def read_process_table(path):
+    """ProcessTable whose input columns are views onto the mapped file; every
+    scheduler accepts it as is, and only the result columns are allocated."""
+    c = _expect(path, "process")
+    time_type = 'd' if 'd' in (c["arrival"].format, c["burst"].format) else 'q'
+    return ProcessTable(c["pid"], c["arrival"], c["burst"], c["priority"], time_type)
+
+
+def write_allocation_trace(path, trace):
+    # trace: (kinds, pids, sizes) columns, as from generate_allocation_trace
+    kinds, pids, sizes = trace
+    write_trace(path, "allocation", {"kind": kinds, "pid": pids, "size": sizes}, {"kind": "b"})
+
+
+def read_allocation_trace(path):
+    # (kinds, pids, sizes) views; WorkloadGenerator.allocation_events turns them into replay events
+    c = _expect(path, "allocation")
+    return c["kind"], c["pid"], c["size"]
+
+
+def write_address_trace(path, addresses):
+    write_trace(path, "address", {"address": addresses})
+
+
+def read_address_trace(path):
+    return _expect(path, "address")["address"]
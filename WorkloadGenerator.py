@@ -0,0 +1,226 @@
+# Seeded synthetic workloads for stress-testing the simulators, drawn from
+# the distributions real systems tend to show instead of small uniform ints:
+#
+#   generate_process_table    Poisson or bursty arrivals, exponential, Pareto or
+#                             bimodal bursts, Zipf priorities -> ProcessTable
+#   generate_allocation_trace alloc/free events for Allocator.replay, with
+#                             heavy-tailed sizes and exponential lifetimes
+#   generate_address_trace    addresses with Zipf page popularity and optional
+#                             working-set phases, for writeTrace / DemandPager
+#
+# Everything is drawn in bulk with NumPy when it is installed and written
+# straight into typed columns, so 10M processes take seconds. Without NumPy the
+# same distributions are drawn with the random module (slower, and a given
+# seed gives a different, equally valid stream).
+
+import math
+import random
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback below
+    np = None
+
+from SchedulingAlgorithms.Scheduling import ProcessTable
+from Pagging import pageOffset
+
+ARRIVALS = ("poisson", "bursty")
+BURSTS = ("exponential", "pareto", "bimodal")
+SIZES = ("exponential", "pareto")
+
+
+def _rng(seed):
+    return np.random.default_rng(seed) if np is not None else random.Random(seed)
+
+
+def _int_column(values):
+    # int64 array.array from a NumPy array (one bulk copy) or any iterable
+    if np is not None and isinstance(values, np.ndarray):
+        column = array('q')
+        column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        return column
+    return array('q', values)
+
+
+def _zipf_cdf(k, s):
+    # Cumulative distribution of a Zipf law truncated to ranks 1..k
+    weights = list(accumulate(1 / (rank ** s) for rank in range(1, k + 1)))
+    return [w / weights[-1] for w in weights]
+
+
+def _zipf_ranks(rng, n, k, s):
+    # n ranks in 0..k-1, rank r drawn with probability proportional to 1/(r+1)^s
+    cdf = _zipf_cdf(k, s)
+    if np is not None:
+        return np.minimum(np.searchsorted(np.asarray(cdf), rng.random(n), side='right'), k - 1)
+    return rng.choices(range(k), cum_weights=cdf, k=n)
+
+
+def _exponential(rng, mean, n):
+    if np is not None:
+        return rng.exponential(mean, n)
+    return [rng.expovariate(1 / mean) for _ in range(n)]
+
+
+def _pareto(rng, shape, mean, n):
+    # Pareto with the given tail index, scaled so its mean is `mean` (shape > 1)
+    if shape <= 1:
+        raise ValueError("pareto_shape must be > 1 for the mean to exist")
+    scale = mean * (shape - 1) / shape
+    if np is not None:
+        return (rng.pareto(shape, n) + 1) * scale
+    return [scale * rng.paretovariate(shape) for _ in range(n)]
+
+
+def _interarrivals(rng, n, kind, rate, cluster):
+    if kind == "poisson":
+        return _exponential(rng, 1 / rate, n)
+    # Bursty: a two-phase hyperexponential. A gap is short (a tenth of the mean)
+    # with probability 1 - 1/cluster, so arrivals come in clumps of about
+    # `cluster` processes, and the long gaps keep the overall rate at `rate`.
+    p_short = 1 - 1 / cluster
+    short = 0.1 / rate
+    long = (1 / rate - p_short * short) / (1 - p_short)
+    if np is not None:
+        return rng.exponential(np.where(rng.random(n) < p_short, short, long))
+    return [rng.expovariate(1 / (short if rng.random() < p_short else long)) for _ in range(n)]
+
+
+def _bursts(rng, n, kind, mean_burst, pareto_shape, bimodal):
+    if kind == "exponential":
+        return _exponential(rng, mean_burst, n)
+    if kind == "pareto":
+        return _pareto(rng, pareto_shape, mean_burst, n)
+    # Bimodal: mostly short interactive jobs plus a fraction of long batch jobs
+    short, long, p_long = bimodal
+    if np is not None:
+        return rng.exponential(np.where(rng.random(n) < p_long, long, short))
+    return [rng.expovariate(1 / (long if rng.random() < p_long else short)) for _ in range(n)]
+
+
+def generate_process_table(n, seed=0, arrival="poisson", rate=0.1, cluster=10,
+                           burst="exponential", mean_burst=8, pareto_shape=1.5,
+                           bimodal=(2, 50, 0.1), priority_levels=5, zipf_s=1.2):
+    """n processes (PIDs 1..n) as a ProcessTable sorted by arrival.
+
+    Arrivals are a Poisson process with `rate` arrivals per time unit, or bursty
+    with clumps of about `cluster` arrivals at the same mean rate. Bursts have
+    mean `mean_burst` and are exponential, Pareto (tail index pareto_shape) or
+    bimodal (short mean, long mean, fraction long). Priorities 1..priority_levels
+    follow a Zipf law with exponent zipf_s, so priority 1 is the most common.
+    Times are rounded to integers, bursts up to at least 1.
+    """
+    if arrival not in ARRIVALS:
+        raise ValueError(f"arrival must be one of {ARRIVALS}, got {arrival!r}")
+    if burst not in BURSTS:
+        raise ValueError(f"burst must be one of {BURSTS}, got {burst!r}")
+    if rate <= 0 or mean_burst <= 0 or cluster < 1 or priority_levels < 1:
+        raise ValueError("rate, mean_burst, cluster and priority_levels must be positive")
+    rng = _rng(seed)
+
+    gaps = _interarrivals(rng, n, arrival, rate, cluster)
+    bursts = _bursts(rng, n, burst, mean_burst, pareto_shape, bimodal)
+    ranks = _zipf_ranks(rng, n, priority_levels, zipf_s)
+
+    if np is not None:
+        arrivals = np.floor(np.cumsum(gaps))
+        bursts = np.maximum(np.ceil(bursts), 1)
+        ranks = ranks + 1
+        pid = np.arange(1, n + 1)
+    else:
+        arrivals = [math.floor(t) for t in accumulate(gaps)]
+        bursts = [max(math.ceil(b), 1) for b in bursts]
+        ranks = [r + 1 for r in ranks]
+        pid = range(1, n + 1)
+    return ProcessTable(_int_column(pid), _int_column(arrivals), _int_column(bursts), _int_column(ranks))
+
+
+def generate_allocation_trace(n, seed=0, size="pareto", mean_size=64, pareto_shape=1.5,
+                              max_size=None, mean_lifetime=100):
+    """Columns (kinds, pids, sizes) of an alloc/free trace for n processes.
+
+    Process i allocates at step i and frees after an exponential lifetime with
+    mean `mean_lifetime` steps, so about mean_lifetime blocks are live at once.
+    kinds[k] is 0 for an allocation and 1 for a free; sizes[k] is 0 on frees.
+    Sizes are exponential or Pareto with mean `mean_size`, at least 1 and at
+    most max_size. Every process is freed by the end of the trace.
+    """
+    if size not in SIZES:
+        raise ValueError(f"size must be one of {SIZES}, got {size!r}")
+    rng = _rng(seed)
+    sizes = (_exponential(rng, mean_size, n) if size == "exponential"
+             else _pareto(rng, pareto_shape, mean_size, n))
+    lifetimes = _exponential(rng, mean_lifetime, n)
+
+    if np is not None:
+        sizes = np.maximum(np.ceil(sizes), 1)
+        if max_size is not None:
+            sizes = np.minimum(sizes, max_size)
+        steps = np.arange(n)
+        # Allocations sit on whole steps, frees in between; a stable sort keeps
+        # each allocation ahead of its own free even for a zero lifetime
+        order = np.argsort(np.concatenate((steps, steps + lifetimes)), kind='stable')
+        kinds = (order >= n).astype(np.int8)
+        pids = order % n + 1
+        sizes = np.concatenate((sizes, np.zeros(n)))[order]
+        return array('b', kinds.tobytes()), _int_column(pids), _int_column(sizes)
+
+    sizes = [max(math.ceil(s), 1) for s in sizes]
+    if max_size is not None:
+        sizes = [min(s, max_size) for s in sizes]
+    times = list(range(n)) + [i + life for i, life in enumerate(lifetimes)]
+    order = sorted(range(2 * n), key=times.__getitem__)
+    kinds = array('b', (k >= n for k in order))
+    pids = array('q', (k % n + 1 for k in order))
+    sizes = array('q', (sizes[k] if k < n else 0 for k in order))
+    return kinds, pids, sizes
+
+
+def allocation_events(trace):
+    # Turns generate_allocation_trace columns into Allocator.replay events
+    kinds, pids, sizes = trace
+    for kind, pid, size in zip(kinds, pids, sizes):
+        yield ("free", pid) if kind else ("alloc", pid, size)
+
+
+def generate_address_trace(n, seed=0, pages=1024, zipf_s=1.0, phase_length=None,
+                           page_offset=pageOffset):
+    """n logical addresses over `pages` pages of 2**page_offset bytes.
+
+    Page popularity follows a Zipf law (exponent zipf_s) over a random ranking
+    of the pages. With phase_length set, the ranking is rotated by a random
+    amount every phase_length references, which moves the working set the
+    way program phases do. The offset within the page is uniform.
+    """
+    rng = _rng(seed)
+    ranks = _zipf_ranks(rng, n, pages, zipf_s)
+    phases = (n + phase_length - 1) // phase_length if phase_length else 1
+
+    if np is not None:
+        ranking = rng.permutation(pages)
+        page = ranking[ranks]
+        if phase_length:
+            shifts = rng.integers(0, pages, phases)
+            page = (page + np.repeat(shifts, phase_length)[:n]) % pages
+        offsets = rng.integers(0, 1 << page_offset, n)
+        return _int_column((page << page_offset) | offsets)
+
+    ranking = list(range(pages))
+    rng.shuffle(ranking)
+    shifts = [rng.randrange(pages) for _ in range(phases)] if phase_length else [0]
+    size = 1 << page_offset
+    return array('q', (((ranking[r] + shifts[k // phase_length if phase_length else 0]) % pages) << page_offset
+                       | rng.randrange(size) for k, r in enumerate(ranks)))
+
+
+if __name__ == "__main__":
+    table = generate_process_table(100000, arrival="bursty", burst="pareto")
+    print(f"{len(table)} processes, last arrival {table.arrival[-1]}, "
+          f"mean burst {sum(table.burst) / len(table):.2f}, "
+          f"priority 1 share {sum(1 for p in table.priority if p == 1) / len(table):.2%}")
+    kinds, pids, sizes = generate_allocation_trace(100000)
+    print(f"{len(kinds)} allocator events, mean size {sum(sizes) / (len(sizes) - sum(kinds)):.1f}")
+    addresses = generate_address_trace(100000, phase_length=10000)
+    print(f"{len(addresses)} addresses over {len(set(a >> pageOffset for a in addresses))} distinct pages")
@@ -0,0 +1,268 @@
+import random
+
+import pytest
+
+from ContiguousMemoryAllocation import (ALLOCATORS, BuddyAllocator, MemoryManager, SegregatedListAllocator,
+                                        best_fit, first_fit, worst_fit)
+
+
+# Reference: the original linear scans over the block list
+def scan_best_fit(blocks, processes):
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        best = -1
+        for j, block in enumerate(blocks):
+            if block >= size and (best == -1 or block < blocks[best]):
+                best = j
+        if best != -1:
+            allocation[i] = best
+            blocks[best] -= size
+    return allocation
+
+
+def scan_first_fit(blocks, processes):
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        for j, block in enumerate(blocks):
+            if block >= size:
+                allocation[i] = j
+                blocks[j] -= size
+                break
+    return allocation
+
+
+def scan_worst_fit(blocks, processes):
+    allocation = [-1] * len(processes)
+    for i, size in enumerate(processes):
+        worst = -1
+        for j, block in enumerate(blocks):
+            if block >= size and (worst == -1 or block > blocks[worst]):
+                worst = j
+        if worst != -1:
+            allocation[i] = worst
+            blocks[worst] -= size
+    return allocation
+
+
+@pytest.mark.parametrize("fit, scan", [(best_fit, scan_best_fit), (first_fit, scan_first_fit),
+                                       (worst_fit, scan_worst_fit)])
+def test_fits_match_linear_scans(fit, scan):
+    rng = random.Random(3)
+    for _ in range(500):
+        # Few distinct sizes, so equal blocks (ties), exact fits and requests
+        # larger than every block all come up often
+        blocks = [rng.choice([0, 5, 10, 10, 20, 40]) for _ in range(rng.randint(0, 30))]
+        processes = [rng.choice([1, 5, 10, 20, 40, 41]) for _ in range(rng.randint(0, 30))]
+        expected_blocks, got_blocks = list(blocks), list(blocks)
+        assert fit(got_blocks, processes) == scan(expected_blocks, processes)
+        assert got_blocks == expected_blocks
+
+
+@pytest.mark.parametrize("fit, scan", [(best_fit, scan_best_fit), (first_fit, scan_first_fit),
+                                       (worst_fit, scan_worst_fit)])
+def test_fits_match_linear_scans_many_blocks(fit, scan):
+    # Enough blocks for the sorted buckets to split and the tree to be deep
+    rng = random.Random(4)
+    blocks = [rng.randint(0, 300) for _ in range(2000)]
+    processes = [rng.randint(1, 320) for _ in range(3000)]
+    expected_blocks, got_blocks = list(blocks), list(blocks)
+    assert fit(got_blocks, processes) == scan(expected_blocks, processes)
+    assert got_blocks == expected_blocks
+
+
+def test_fit_edge_cases():
+    for fit in (best_fit, first_fit, worst_fit):
+        assert fit([], [5]) == [-1]
+        assert fit([10], []) == []
+        blocks = [10, 10]
+        assert fit(blocks, [10, 10, 1]) == [0, 1, -1]
+        assert blocks == [0, 0]
+
+
+def check_partition(allocator, holes, total):
+    # Free and used blocks tile [0, total) exactly: no overlap, no gap
+    blocks = sorted(list(holes) + list(allocator.allocations.values()))
+    address = 0
+    for start, size in blocks:
+        assert start == address and size > 0
+        address += size
+    assert address == total
+
+
+def random_events(rng, steps, max_size):
+    live, next_pid = [], 0
+    for _ in range(steps):
+        if live and rng.random() < 0.45:
+            yield "free", live.pop(rng.randrange(len(live)))
+        else:
+            yield "alloc", next_pid, rng.randint(1, max_size)
+            live.append(next_pid)
+            next_pid += 1
+
+
+def reference_hole(holes, size, fit):
+    # Placement over a plain address-ordered hole list
+    fitting = [(start, hole) for start, hole in holes if hole >= size]
+    if not fitting:
+        return None
+    if fit == "first":
+        return fitting[0]
+    if fit == "best":
+        return min(fitting, key=lambda h: (h[1], h[0]))
+    return min(fitting, key=lambda h: (-h[1], h[0]))
+
+
+@pytest.mark.parametrize("fit", ["first", "best", "worst"])
+def test_memory_manager_placement_and_coalescing(fit):
+    rng = random.Random(5)
+    manager = MemoryManager(1000, fit)
+    for event in random_events(rng, 3000, 120):
+        holes = list(manager.holes)
+        if event[0] == "alloc":
+            hole = reference_hole(holes, event[2], fit)
+            assert manager.allocate(event[1], event[2]) == (-1 if hole is None else hole[0])
+        elif event[1] in manager.allocations:
+            manager.free(event[1])
+            # Coalescing: a hole never ends where the next one starts
+            holes = list(manager.holes)
+            assert all(a + n < b for (a, n), (b, _) in zip(holes, holes[1:]))
+        check_partition(manager, manager.holes, 1000)
+        assert sorted((n, a) for a, n in manager.holes) == [item for bucket in manager.by_size.buckets
+                                                             for item in bucket]
+
+
+def test_memory_manager_compaction():
+    manager = MemoryManager(100, "first")
+    for pid in range(10):
+        assert manager.allocate(pid, 10) == 10 * pid
+    for pid in range(0, 10, 2):
+        manager.free(pid)
+    # 50 free in five holes of 10: a 30 request fails without compaction
+    assert manager.allocate("big", 30) == -1
+    manager.compact()
+    assert list(manager.holes) == [(50, 50)]
+    assert sorted(manager.allocations.values()) == [(10 * k, 10) for k in range(5)]
+    assert manager.moved == 50 and manager.compactions == 1
+    check_partition(manager, manager.holes, 100)
+
+    on_demand = MemoryManager(100, "first", compact_on_demand=True)
+    for pid in range(10):
+        on_demand.allocate(pid, 10)
+    for pid in range(0, 10, 2):
+        on_demand.free(pid)
+    assert on_demand.allocate("big", 30) == 50
+    check_partition(on_demand, on_demand.holes, 100)
+
+    threshold = MemoryManager(100, "first", compaction_threshold=0.5)
+    for pid in range(10):
+        threshold.allocate(pid, 10)
+    for pid in range(0, 10, 2):
+        threshold.free(pid)
+        assert threshold.fragmentation() <= 0.5
+    assert threshold.compactions > 0
+
+
+def test_next_fit_resumes_at_rover():
+    manager = MemoryManager(100, "next")
+    for pid in range(5):
+        manager.allocate(pid, 20)
+    manager.free(1)
+    manager.free(3)
+    # Holes at 20 and 60; the rover sits at the end of memory, so the search wraps
+    assert manager.allocate("a", 10) == 20
+    assert manager.rover == 30
+    assert manager.allocate("b", 10) == 30
+    manager.free("a")
+    # First fit would take 20 again; next fit carries on from the rover
+    assert manager.allocate("c", 10) == 60
+    assert manager.allocate("d", 10) == 70
+    assert manager.allocate("e", 10) == 20
+    assert manager.allocate("f", 10) == -1
+
+    rng = random.Random(6)
+    manager = MemoryManager(1000, "next")
+    for event in random_events(rng, 3000, 120):
+        if event[0] == "alloc":
+            holes = list(manager.holes)
+            later = [hole for hole in holes if hole[0] >= manager.rover and hole[1] >= event[2]]
+            hole = later[0] if later else reference_hole(holes, event[2], "first")
+            assert manager.allocate(event[1], event[2]) == (-1 if hole is None else hole[0])
+        elif event[1] in manager.allocations:
+            manager.free(event[1])
+        check_partition(manager, manager.holes, 1000)
+
+
+def buddy_free_blocks(buddy):
+    return [(address, 1 << order) for order, free in enumerate(buddy.free_sets) for address in free]
+
+
+def test_buddy_split_and_merge():
+    buddy = BuddyAllocator(1024)
+    assert buddy.allocate("a", 1) == 0
+    # One split per order, each leaving its upper half free
+    assert sorted(buddy_free_blocks(buddy)) == [(1 << k, 1 << k) for k in range(10)]
+    assert buddy.allocate("b", 3) == 4
+    assert buddy.allocate("c", 1) == 1
+    for pid in ("c", "a", "b"):
+        buddy.free(pid)
+    assert buddy_free_blocks(buddy) == [(0, 1024)]
+
+
+@pytest.mark.parametrize("size", [1024, 1000])
+def test_buddy_invariants(size):
+    rng = random.Random(size)
+    buddy = BuddyAllocator(size, min_order=2)
+    initial = sorted(buddy_free_blocks(buddy))
+    covered = sum(block for _, block in initial)
+    for event in random_events(rng, 3000, 100):
+        if event[0] == "alloc":
+            buddy.allocate(event[1], event[2])
+        elif event[1] in buddy.allocations:
+            buddy.free(event[1])
+        free = buddy_free_blocks(buddy)
+        check_partition(buddy, free, covered)
+        for address, block in free + list(buddy.allocations.values()):
+            assert address % block == 0
+        # Fully merged: no free block has its buddy free at the same order
+        free = set(free)
+        assert not any((address ^ block, block) in free for address, block in free)
+    for pid in list(buddy.allocations):
+        buddy.free(pid)
+    assert sorted(buddy_free_blocks(buddy)) == initial
+
+
+def test_segregated_reuses_slots():
+    allocator = SegregatedListAllocator(256, min_class=16)
+    assert allocator.allocate("a", 10) == 0
+    assert allocator.allocate("b", 17) == 16
+    allocator.free("a")
+    assert allocator.allocate("c", 16) == 0
+    assert allocator.allocate("d", 200) == -1
+    rng = random.Random(7)
+    allocator = SegregatedListAllocator(4096, min_class=16)
+    for event in random_events(rng, 3000, 300):
+        if event[0] == "alloc":
+            allocator.allocate(event[1], event[2])
+        elif event[1] in allocator.allocations:
+            allocator.free(event[1])
+        slots = [(address, 1 << order) for order, stack in allocator.free_lists.items() for address in stack]
+        if allocator.top < allocator.size:
+            slots.append((allocator.top, allocator.size - allocator.top))
+        check_partition(allocator, slots, allocator.size)
+
+
+@pytest.mark.parametrize("name", sorted(ALLOCATORS))
+def test_allocations_never_overlap(name):
+    rng = random.Random(8)
+    allocator = ALLOCATORS[name](2048)
+    for event in random_events(rng, 2000, 200):
+        if event[0] == "alloc":
+            start = allocator.allocate(event[1], event[2])
+            if start != -1:
+                assert allocator.allocations[event[1]][1] >= event[2]
+        elif event[1] in allocator.allocations:
+            allocator.free(event[1])
+        blocks = sorted(allocator.allocations.values())
+        assert all(a + n <= b for (a, n), (b, _) in zip(blocks, blocks[1:]))
+        assert not blocks or blocks[-1][0] + blocks[-1][1] <= allocator.size
+        assert allocator.reserved == sum(n for _, n in blocks)
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from BankersAlgorithm import BankersState, bankers_algorithm, is_safe_state
+
+
+def classic_safety(Available, Allocation, Need):
+    # Reference: rescan from P0 after every process that can finish
+    Work, finished, sequence = list(Available), [False] * len(Need), []
+    while True:
+        for i in range(len(Need)):
+            if not finished[i] and all(n <= w for n, w in zip(Need[i], Work)):
+                finished[i] = True
+                sequence.append(i)
+                Work = [w + a for w, a in zip(Work, Allocation[i])]
+                break
+        else:
+            return all(finished), sequence
+
+
+def random_state(rng, n, m):
+    Allocation = [[rng.randint(0, 4) for _ in range(m)] for _ in range(n)]
+    Max = [[a + rng.randint(0, 6) for a in row] for row in Allocation]
+    Available = [rng.randint(0, 6) for _ in range(m)]
+    return Max, Allocation, Available
+
+
+def test_safety_check_matches_classic_scan():
+    rng = random.Random(1)
+    outcomes = set()
+    for _ in range(2000):
+        Max, Allocation, Available = random_state(rng, rng.randint(0, 12), rng.randint(0, 4))
+        Need = [[mx - al for mx, al in zip(*rows)] for rows in zip(Max, Allocation)]
+        expected = classic_safety(Available, Allocation, Need)
+        assert is_safe_state(Available, Allocation, Need) == expected
+        outcomes.add(expected[0])
+    assert outcomes == {True, False}
+
+
+def test_bankers_algorithm_returns_need():
+    is_safe, sequence, Need = bankers_algorithm([[7, 5, 3], [3, 2, 2], [9, 0, 2], [2, 2, 2], [4, 3, 3]],
+                                                [[0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]],
+                                                [3, 3, 2])
+    assert is_safe and sequence == [1, 3, 0, 2, 4]
+    assert Need[0] == [7, 4, 3]
+
+
+def test_bankers_state_matches_full_check():
+    # Every request is granted exactly when the classic check says the
+    # resulting state is safe, whichever of the prefix or full check decided it
+    rng = random.Random(2)
+    for _ in range(100):
+        n, m = rng.randint(1, 8), rng.randint(1, 3)
+        Max, Allocation, Available = random_state(rng, n, m)
+        Need = [[mx - al for mx, al in zip(*rows)] for rows in zip(Max, Allocation)]
+        if not classic_safety(Available, Allocation, Need)[0]:
+            continue
+        state = BankersState(Max, Allocation, Available)
+        for _ in range(40):
+            pid = rng.randrange(n)
+            if rng.random() < 0.3:
+                vector = [rng.randint(0, a) for a in state.Allocation[pid]]
+                state.release(pid, vector)
+                continue
+            vector = [rng.randint(0, min(need, 3)) for need in state.Need[pid]]
+            before = [row[:] for row in state.Allocation], state.Available[:]
+            fits = all(v <= a for v, a in zip(vector, state.Available))
+            after_alloc = [row[:] for row in state.Allocation]
+            after_alloc[pid] = [a + v for a, v in zip(after_alloc[pid], vector)]
+            after_need = [[mx - al for mx, al in zip(*rows)] for rows in zip(Max, after_alloc)]
+            after_avail = [a - v for a, v in zip(state.Available, vector)]
+            expected = fits and classic_safety(after_avail, after_alloc, after_need)[0]
+            assert state.request(pid, vector) == expected
+            if not expected:
+                assert (state.Allocation, state.Available) == before
+            assert is_safe_state(state.Available, state.Allocation, state.Need)[0]
+            assert state.Need == [[mx - al for mx, al in zip(*rows)] for rows in zip(Max, state.Allocation)]
+
+
+def textbook_state():
+    return BankersState([[7, 5, 3], [3, 2, 2], [9, 0, 2], [2, 2, 2], [4, 3, 3]],
+                        [[0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]],
+                        [3, 3, 2])
+
+
+def test_request_granted_denied_and_over_claim():
+    state = textbook_state()
+    assert state.request(1, [1, 0, 2])
+    assert state.Available == [2, 3, 0] and state.Need[1] == [0, 2, 0]
+    # Enough is free, but granting it would leave no safe sequence
+    assert not state.request(0, [0, 2, 0])
+    assert state.Available == [2, 3, 0] and state.Allocation[0] == [0, 1, 0]
+    # More than is free: has to wait
+    assert not state.request(4, [3, 3, 0])
+    assert state.denied == 2 and state.granted == 1
+    with pytest.raises(ValueError, match="maximum claim"):
+        state.request(3, [0, 2, 0])
+
+
+def test_release():
+    state = textbook_state()
+    state.release(2, [3, 0, 0])
+    assert state.Available == [6, 3, 2] and state.Need[2] == [9, 0, 0]
+    with pytest.raises(ValueError, match="more than it holds"):
+        state.release(2, [1, 0, 0])
+    assert state.request(2, [6, 0, 0])
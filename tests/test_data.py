@@ -0,0 +1,68 @@
+import json
+import tracemalloc
+
+import pytest
+
+from SchedulingAlgorithms import data
+from SchedulingAlgorithms.Scheduling import ProcessTable
+
+
+def write(tmp_path, text):
+    path = tmp_path / "processes.json"
+    path.write_text(text)
+    return str(path)
+
+
+def test_array_read_in_small_chunks(tmp_path):
+    rows = [{"PID": i, "ArrivalTime": i, "BurstTime": 2, "Name": "pé"} for i in range(1, 40)]
+    path = write(tmp_path, json.dumps(rows))
+    for chunk_size in (1, 7, 1 << 16):
+        assert list(data.iter_processes_from_file(path, chunk_size=chunk_size)) == rows
+
+
+def test_array_syntax_error_is_collected_with_offset(tmp_path):
+    text = json.dumps([{"PID": i, "ArrivalTime": 0, "BurstTime": 1} for i in range(1, 6)])
+    cut = text.index('}, {"PID": 3') + 1
+    broken = text[:cut] + " x" + text[cut + 1:]
+    path = write(tmp_path, broken)
+    errors = []
+    rows = list(data.iter_processes_from_file(path, errors, chunk_size=8))
+    assert [row["PID"] for row in rows] == [1, 2]
+    assert errors == [(3, f"invalid JSON (Expecting value at byte offset {cut + 1})")]
+    with pytest.raises(ValueError, match="row 3"):
+        list(data.iter_processes_from_file(path))
+
+
+def test_array_missing_closing_bracket(tmp_path):
+    path = write(tmp_path, '[{"PID": 1, "ArrivalTime": 0, "BurstTime": 1},')
+    errors = []
+    assert len(list(data.iter_processes_from_file(path, errors, chunk_size=4))) == 1
+    assert errors[0][0] == 2 and "unexpected end of file" in errors[0][1]
+
+
+def test_oversized_element_stops_the_scan(tmp_path):
+    path = write(tmp_path, '[{"PID": 1, "Name": "' + "a" * 5000)
+    with open(path) as f:
+        rows = list(data._iter_json_array(f, chunk_size=64, max_element=1000))
+    assert [(row, value.msg) for row, value in rows] == [(1, "element longer than 1000 characters at byte offset 1")]
+
+
+def test_load_process_table_streams(tmp_path):
+    rows = [{"PID": i, "ArrivalTime": i, "BurstTime": 2, "Priority": 1} for i in range(20000)]
+    path = tmp_path / "processes.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in rows))
+
+    def peak(load):
+        tracemalloc.start()
+        try:
+            result = load()
+            return result, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    table, streamed = peak(lambda: data.load_process_table(str(path), rows_per_chunk=500))
+    _, collected = peak(lambda: ProcessTable.from_dicts(list(data.iter_processes_from_file(str(path)))))
+    assert list(table.pid) == list(range(20000))
+    # Only one chunk of dicts is alive at a time, not all 20000
+    assert streamed < collected / 4
+
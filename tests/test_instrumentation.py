@@ -0,0 +1,55 @@
+import pytest
+
+import Instrumentation
+import Pagging
+from ContiguousMemoryAllocation import best_fit, first_fit, worst_fit
+from Instrumentation import Profiler, set_profiler
+from SchedulingAlgorithms.Scheduling import srtf
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    previous = set_profiler(profiler)
+    yield profiler
+    set_profiler(previous)
+
+
+def test_disabled_by_default():
+    assert Instrumentation.profiler is None
+
+
+def test_fit_scan_counters(profiler):
+    with profiler.phase("first_fit"):
+        first_fit([100, 500, 3], [50, 9999])
+    with profiler.phase("best_fit"):
+        best_fit([100, 500, 200], [212, 417, 600])
+    with profiler.phase("worst_fit"):
+        worst_fit([10], [2, 20])
+    counters = profiler.to_dict()["counters"]
+    # 4 leaves, depth 2: 1 root check per request plus 2 levels per placement
+    assert counters["first_fit"]["tree_nodes_visited"] == 2 + 2
+    assert counters["first_fit"]["tree_nodes_updated"] == 3
+    assert counters["best_fit"]["bisections"] == 3 + 1
+    assert counters["worst_fit"] == {"blocks": 1, "heap_replaces": 1, "heap_top_checks": 2,
+                                     "requests": 2, "unallocated": 1}
+
+
+def test_scheduler_phases_and_export(profiler, tmp_path):
+    processes = [{'PID': 1, 'ArrivalTime': 0, 'BurstTime': 5}, {'PID': 2, 'ArrivalTime': 1, 'BurstTime': 1}]
+    with profiler.phase("srtf"):
+        srtf(processes)
+    counters = profiler.to_dict()["counters"]["srtf"]
+    assert counters["preemptions"] == 1 and counters["context_switches"] == 2
+    assert {line.rsplit(" ", 1)[0] for line in profiler.folded()} == {"srtf", "srtf;schedule", "srtf;metrics"}
+    profiler.write_json(tmp_path / "profile.json")
+    assert (tmp_path / "profile.json").stat().st_size > 0
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_translate_batch_counters(profiler, monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(Pagging, "np", None)
+    with profiler.phase("batch"):
+        Pagging.translateBatch([0, 1000, -1, 300])
+    assert profiler.to_dict()["counters"]["batch"] == {"addresses": 4, "invalid": 2}
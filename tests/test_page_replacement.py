@@ -0,0 +1,29 @@
+import random
+
+from PageReplacement import OPTReplacement
+
+
+def naive_opt(frames, pages):
+    resident, faults = [], 0
+    for i, page in enumerate(pages):
+        if page in resident:
+            continue
+        faults += 1
+        if len(resident) >= frames:
+            later = pages[i + 1:]
+            resident.remove(max(resident, key=lambda p: later.index(p) if p in later else len(pages)))
+        resident.append(page)
+    return faults
+
+
+def test_opt_heap_stays_bounded():
+    rng = random.Random(0)
+    frames = 4
+    # Mostly hits on a small working set, which used to pile up stale entries
+    pages = [rng.randrange(6) for _ in range(5000)]
+    policy = OPTReplacement(frames, pages)
+    faults = 0
+    for page in pages:
+        faults += policy.access(page)[0]
+        assert len(policy.furthest) <= 2 * frames
+    assert faults == naive_opt(frames, pages)
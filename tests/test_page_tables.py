@@ -0,0 +1,62 @@
+import pytest
+
+from PageTables import InvertedPageTable, MultiLevelPageTable
+from Pagging import TLB
+
+
+@pytest.mark.parametrize("pageNumber", [-1, 1 << 20])
+def test_multilevel_rejects_pages_outside_address_space(pageNumber):
+    table = MultiLevelPageTable(addressBits=32, pageBits=12, levels=2)
+    table.map(5, 7)
+    with pytest.raises(ValueError):
+        table.lookup(pageNumber)
+    with pytest.raises(ValueError):
+        table.translate(pageNumber << 12)
+    assert table.lookup(5) == (7, 2)
+
+
+def test_inverted_tlb_does_not_leak_between_processes():
+    table = InvertedPageTable(frames=4)
+    table.map(3, 1, pid=1)
+    table.map(3, 2, pid=2)
+    tlb = TLB(entries=4)
+    assert table.translate(3 << 12, pid=1, tlb=tlb) >> 12 == 1
+    assert table.translate(3 << 12, pid=2, tlb=tlb) >> 12 == 2
+    assert table.translate(3 << 12, pid=1, tlb=tlb) >> 12 == 1
+    # Back-to-back accesses by one process still hit
+    table.translate(3 << 12, pid=1, tlb=tlb)
+    assert tlb.hits == 1
+
+
+def test_multilevel_tlb_follows_unmap_and_remap():
+    table = MultiLevelPageTable(addressBits=32, pageBits=12, levels=2)
+    tlb = TLB(entries=4)
+    table.map(5, 7)
+    assert table.translate(5 << 12, tlb=tlb) >> 12 == 7
+    assert table.translate(5 << 12, tlb=tlb) >> 12 == 7
+    assert tlb.hits == 1
+    table.unmap(5)
+    with pytest.raises(ValueError):
+        table.translate(5 << 12, tlb=tlb)
+    table.map(5, 7)
+    table.translate(5 << 12, tlb=tlb)
+    table.map(5, 9)
+    assert table.translate(5 << 12, tlb=tlb) >> 12 == 9
+
+
+def test_inverted_tlb_follows_remap_and_unmap():
+    table = InvertedPageTable(frames=4)
+    tlb = TLB(entries=4)
+    table.map(3, 1)
+    assert table.translate(3 << 12, tlb=tlb) >> 12 == 1
+    table.map(3, 2)
+    assert table.translate(3 << 12, tlb=tlb) >> 12 == 2
+    # Frame 2 handed to another page evicts page 3
+    table.map(4, 2)
+    with pytest.raises(ValueError):
+        table.translate(3 << 12, tlb=tlb)
+    table.map(3, 0)
+    table.translate(3 << 12, tlb=tlb)
+    table.unmapFrame(0)
+    with pytest.raises(ValueError):
+        table.translate(3 << 12, tlb=tlb)
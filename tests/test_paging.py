@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+import Pagging
+from Pagging import _translateBatchPython, logicalToPhysical, translateBatch
+
+TABLES = {
+    "default": Pagging.pageMapTable,
+    "dense_with_gaps": {0: 3, 2: 4, 7: 1, 40: 0},
+    # Far too sparse for a dense frame array: translateBatch binary-searches it
+    "sparse": {0: 3, 5: 1, 10 ** 9: 7, 10 ** 12: 2},
+    "empty": {},
+}
+
+
+def reference(addresses, table, monkeypatch):
+    monkeypatch.setattr(Pagging, "pageMapTable", table)
+    physical, valid = [], []
+    for address in addresses:
+        try:
+            physical.append(-1 if address < 0 else logicalToPhysical(address))
+        except ValueError:
+            physical.append(-1)
+        valid.append(physical[-1] != -1)
+    return physical, valid
+
+
+def random_addresses(table, count=2000, seed=0):
+    rng = random.Random(seed)
+    pages = list(table) + [max(table, default=0) + 1, 1, 6, 10 ** 9 + 1]
+    addresses = [(rng.choice(pages) << Pagging.pageOffset) + rng.randrange(Pagging.pageSize)
+                 for _ in range(count)]
+    return addresses + [-1, -Pagging.pageSize, 0, Pagging.pageSize - 1]
+
+
+@pytest.mark.parametrize("name", sorted(TABLES))
+def test_batch_paths_match_logical_to_physical(name, monkeypatch):
+    table = TABLES[name]
+    addresses = random_addresses(table)
+    expected = reference(addresses, table, monkeypatch)
+
+    physical, valid = _translateBatchPython(addresses, table)
+    assert (list(physical), [bool(v) for v in valid]) == expected
+
+    if Pagging.np is not None:
+        physical, valid = translateBatch(Pagging.np.array(addresses), table)
+        assert (physical.tolist(), valid.tolist()) == expected
+
+    # translateBatch without NumPy takes the pure-Python path
+    monkeypatch.setattr(Pagging, "np", None)
+    physical, valid = translateBatch(addresses, table)
+    assert (list(physical), [bool(v) for v in valid]) == expected
+
+
+def test_tlb_invalidate():
+    tlb = Pagging.TLB(entries=4, ways=2)
+    tlb.insert(1, 10)
+    tlb.insert(3, 30)
+    tlb.invalidate(1)
+    tlb.invalidate(5)  # not cached: nothing happens
+    assert tlb.lookup(1) is None
+    assert tlb.lookup(3) == 30
+    # The freed way is reused without evicting page 3
+    tlb.insert(5, 50)
+    assert tlb.lookup(3) == 30 and tlb.lookup(5) == 50
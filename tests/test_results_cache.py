@@ -0,0 +1,52 @@
+import os
+import time
+
+import ResultsCache as results_cache
+from ResultsCache import ResultsCache
+from SchedulingAlgorithms import data
+
+
+def processes():
+    return [{'PID': pid, 'ArrivalTime': arrival, 'BurstTime': burst, 'Priority': 1}
+            for pid, arrival, burst in [(3, 0, 4), (1, 1, 2), (2, 2, 3)]]
+
+
+def test_compare_algorithms_leaves_cached_rows_intact(tmp_path):
+    for cache in (ResultsCache(), ResultsCache(directory=str(tmp_path))):
+        first = data.compare_algorithms(processes(), plot=False, cache=cache)
+        first[0]["results"].append("mutated")
+        first[0]["gantt"].clear()
+        second = data.compare_algorithms(processes(), plot=False, cache=cache)
+        assert cache.hits == len(data.ALGORITHMS)
+        # format_results sorts by PID for printing, not the cached list itself
+        assert [p['PID'] for p in second[0]["results"]] == [3, 1, 2]
+        assert second[0]["gantt"] and second[0]["results"][-1] != "mutated"
+
+
+def test_key_tracks_the_algorithm_source(tmp_path, monkeypatch):
+    source = tmp_path / "edited_algorithm.py"
+    source.write_text("def run(processes):\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(results_cache, "_source_digests", {})
+    import edited_algorithm
+
+    cache = ResultsCache()
+    digest = cache.digest(processes())
+    before = cache.key("run", digest, edited_algorithm.run)
+    assert before == cache.key("run", digest, edited_algorithm.run)
+    assert before != cache.key("run", digest, data.fcfs)
+    assert before != cache.key("run", digest)
+
+    source.write_text("def run(processes):\n    return 2\n")
+    monkeypatch.setattr(results_cache, "_source_digests", {})  # as in a new process
+    assert before != cache.key("run", digest, edited_algorithm.run)
+
+
+def test_stale_temporary_files_are_removed(tmp_path):
+    stale, fresh = tmp_path / "a.tmp", tmp_path / "b.tmp"
+    stale.write_bytes(b"partial")
+    fresh.write_bytes(b"partial")
+    old = time.time() - 2 * results_cache.STALE_TMP_SECONDS
+    os.utime(stale, (old, old))
+    ResultsCache(directory=str(tmp_path))
+    assert not stale.exists() and fresh.exists()
@@ -0,0 +1,215 @@
+import random
+
+import pytest
+
+from SchedulingAlgorithms import Scheduling
+from SchedulingAlgorithms.Scheduling import fcfs
+
+
+def random_processes(rng, n, floats=False):
+    draw = (lambda hi: round(rng.uniform(0, hi), 3)) if floats else (lambda hi: rng.randint(0, hi))
+    return [{'PID': i + 1, 'ArrivalTime': draw(20), 'BurstTime': draw(6) or 1, 'Priority': rng.randint(1, 5)}
+            for i in range(n)]
+
+
+def sequential_fcfs(processes):
+    # Reference: the plain FCFS loop
+    time, out = 0, []
+    for p in sorted(processes, key=lambda p: (p['ArrivalTime'], p['PID'])):
+        start = max(time, p['ArrivalTime'])
+        time = start + p['BurstTime']
+        out.append((p['PID'], start, time))
+    return out
+
+
+@pytest.mark.parametrize("floats", [False, True])
+def test_fcfs_matches_sequential(floats):
+    rng = random.Random(4)
+    for _ in range(200):
+        processes = random_processes(rng, rng.randint(1, 40), floats)
+        _, _, gantt = fcfs(processes)
+        assert gantt == sequential_fcfs(processes)
+        assert all(prev[2] <= nxt[1] for prev, nxt in zip(gantt, gantt[1:]))
+
+
+def test_fcfs_table_gantt_columns():
+    pytest.importorskip("numpy")
+    processes = random_processes(random.Random(8), 500)
+    table, metrics, gantt = fcfs(Scheduling.ProcessTable.from_rows(processes))
+    # Table input keeps the schedule columnar; it reads like the tuple list
+    assert isinstance(gantt, Scheduling.GanttColumns)
+    assert gantt == sequential_fcfs(processes)
+    assert gantt[3] == sequential_fcfs(processes)[3]
+    assert metrics["context_switches"] == Scheduling.count_context_switches(list(gantt))
+
+
+@pytest.mark.parametrize("schedule", [Scheduling.fcfs, Scheduling.sjf, Scheduling.srtf,
+                                      Scheduling.priority_scheduling, Scheduling.round_robin,
+                                      Scheduling.mlfq, Scheduling.preemptive_priority])
+def test_named_pids_and_float_priorities(schedule):
+    # Inputs the dict-based schedulers always took: names as PIDs, fractional priorities
+    processes = [{'PID': 'B', 'ArrivalTime': 0, 'BurstTime': 3, 'Priority': 1.5},
+                 {'PID': 'A', 'ArrivalTime': 0, 'BurstTime': 2, 'Priority': 1}]
+    results, _, gantt = schedule(processes)
+    assert {pid for pid, _, _ in gantt} == {'A', 'B'}
+    assert {p['PID']: p['Priority'] for p in results} == {'A': 1, 'B': 1.5}
+    assert all('CompletionTime' in p for p in results)
+
+
+def test_named_pid_table_columns():
+    assert Scheduling.priority_scheduling(
+        [{'PID': 'A', 'ArrivalTime': 0, 'BurstTime': 3, 'Priority': 1}])[2] == [('A', 0, 3)]
+    # Columns widen only once the chunk holding the first odd value is reached
+    rows = [{'PID': i, 'ArrivalTime': i, 'BurstTime': 1, 'Priority': 1} for i in range(5)]
+    rows.append({'PID': 'last', 'ArrivalTime': 5, 'BurstTime': 1, 'Priority': 0.5})
+    table = Scheduling.ProcessTable.from_rows(rows, chunk_size=2)
+    assert table.pid == [0, 1, 2, 3, 4, 'last']
+    assert table.priority.typecode == 'd' and table.priority[-1] == 0.5
+    assert [p['PID'] for p in fcfs(table)[0].to_dicts()] == table.pid
+
+
+def test_fcfs_without_numpy_matches(monkeypatch):
+    rng = random.Random(5)
+    processes = random_processes(rng, 300)
+    with_numpy = fcfs(processes)
+    monkeypatch.setattr(Scheduling, "np", None)
+    assert fcfs(processes) == with_numpy
+
+
+def check_gantt(processes, result, gantt):
+    # Slices never overlap and every process gets exactly its burst
+    assert all(prev[2] <= nxt[1] for prev, nxt in zip(gantt, gantt[1:]))
+    ran = {}
+    for pid, start, end in gantt:
+        assert end > start
+        ran[pid] = ran.get(pid, 0) + end - start
+    for p in processes:
+        assert ran.get(p['PID'], 0) == pytest.approx(p['BurstTime'])
+    assert all('CompletionTime' in p for p in result)
+
+
+@pytest.mark.parametrize("run", [
+    lambda ps: Scheduling.round_robin(ps, quantum=0.3),
+    lambda ps: Scheduling.mlfq(ps, levels=3, quanta=[0.1, 0.7, 1.3], boost=2.9),
+    lambda ps: Scheduling.preemptive_priority(ps, aging=0.7),
+    lambda ps: Scheduling.preemptive_priority(ps, aging=None),
+])
+def test_time_sliced_float_times_terminate(run):
+    # Float slices used to leave rounding slivers of remaining time behind
+    rng = random.Random(6)
+    for _ in range(100):
+        processes = [{'PID': i, 'ArrivalTime': rng.random() * 20, 'BurstTime': rng.random() * 7 + 1e-9,
+                      'Priority': rng.randint(1, 5)} for i in range(rng.randint(1, 30))]
+        check_gantt(processes, *run(processes)[::2])
+
+
+def test_fractional_quantum_on_integer_times():
+    # An integer table cannot hold the half-unit times, so it is promoted to float
+    processes = [{'PID': i, 'ArrivalTime': i, 'BurstTime': 3, 'Priority': 1} for i in range(5)]
+    check_gantt(processes, *Scheduling.round_robin(processes, quantum=0.5)[::2])
+    result, _, lanes = Scheduling.smp_schedule(processes, cores=2, steal=False, quantum=0.5)
+    for lane in lanes:
+        check_gantt([p for p in processes if any(s[0] == p['PID'] for s in lane)], [], lane)
+    assert all('CompletionTime' in p for p in result)
+    table = Scheduling.ProcessTable.from_dicts(processes)
+    promoted = Scheduling.preemptive_priority(table, aging=2.5)[0]
+    assert promoted.time_type == 'd' and table.time_type == 'q'
+
+
+def tick_preemptive_priority(processes, aging):
+    # Reference: one time unit per step, aging swept over every level each tick
+    from collections import deque
+    live = sorted((p for p in processes if p['BurstTime'] > 0), key=lambda p: p['ArrivalTime'])
+    base = {pr: l for l, pr in enumerate(sorted({p['Priority'] for p in live}))}
+    queues = [deque() for _ in base]
+    rem = {p['PID']: p['BurstTime'] for p in live}
+    time, k, done, running, running_level = 0, 0, {}, None, None
+    while len(done) < len(live):
+        while k < len(live) and live[k]['ArrivalTime'] <= time:
+            queues[base[live[k]['Priority']]].append((time, live[k]))
+            k += 1
+        if aging:
+            for l in range(1, len(queues)):
+                while queues[l] and queues[l][0][0] + aging <= time:
+                    entered, p = queues[l].popleft()
+                    queues[l - 1].append((entered + aging, p))
+        best = next((l for l, q in enumerate(queues) if q), None)
+        if running is not None and best is not None and best < running_level:
+            queues[base[running['Priority']]].append((time, running))
+            running = None
+        if running is None:
+            if best is None:
+                time += 1
+                continue
+            running_level, running = best, queues[best].popleft()[1]
+        rem[running['PID']] -= 1
+        time += 1
+        if rem[running['PID']] == 0:
+            done[running['PID']] = time
+            running = None
+    return done
+
+
+@pytest.mark.parametrize("aging", [None, 1, 3, 8])
+def test_preemptive_priority_matches_tick_reference(aging):
+    rng = random.Random(7)
+    for _ in range(150):
+        processes = [{'PID': i, 'ArrivalTime': rng.randint(0, 30), 'BurstTime': rng.randint(0, 12),
+                      'Priority': rng.randint(1, rng.choice([3, 30]))} for i in range(rng.randint(1, 20))]
+        result = Scheduling.preemptive_priority(processes, aging=aging)[0]
+        completed = {p['PID']: p['CompletionTime'] for p in result if 'CompletionTime' in p}
+        assert completed == tick_preemptive_priority(processes, aging)
+
+
+SINGLE_CORE = {
+    "fcfs": Scheduling.fcfs,
+    "sjf": Scheduling.sjf,
+    "priority": Scheduling.priority_scheduling,
+    "rr": lambda ps: Scheduling.round_robin(ps, quantum=2),
+}
+
+
+@pytest.mark.parametrize("dispatch", ["global", "per-core"])
+@pytest.mark.parametrize("policy", sorted(SINGLE_CORE))
+def test_smp_one_core_matches_uniprocessor(policy, dispatch):
+    rng = random.Random(9)
+    fields = ('StartTime', 'CompletionTime', 'TurnaroundTime', 'WaitingTime')
+    for _ in range(100):
+        processes = random_processes(rng, rng.randint(1, 30))
+        result, metrics, gantt = SINGLE_CORE[policy](processes)
+        smp_result, smp_metrics, lanes = Scheduling.smp_schedule(processes, cores=1, policy=policy,
+                                                                 dispatch=dispatch)
+        assert lanes == [gantt]
+        assert ({p['PID']: [p[f] for f in fields] for p in smp_result}
+                == {p['PID']: [p[f] for f in fields] for p in result})
+        assert {k: smp_metrics[k] for k in metrics} == metrics
+
+
+@pytest.mark.parametrize("floats", [False, True])
+@pytest.mark.parametrize("dispatch,steal", [("global", False), ("per-core", False), ("per-core", True)])
+@pytest.mark.parametrize("policy", sorted(Scheduling.SMP_POLICIES))
+def test_smp_lanes_are_valid_schedules(policy, dispatch, steal, floats):
+    rng = random.Random(10)
+    for _ in range(50):
+        processes = random_processes(rng, rng.randint(1, 40), floats)
+        cores = rng.choice([2, 3, 4])
+        result, metrics, lanes = Scheduling.smp_schedule(processes, cores=cores, policy=policy,
+                                                         dispatch=dispatch, steal=steal)
+        assert len(lanes) == cores
+        arrival = {p['PID']: p['ArrivalTime'] for p in processes}
+        served, segments = {}, []
+        for lane in lanes:
+            # One core runs one slice at a time
+            assert all(prev[2] <= nxt[1] for prev, nxt in zip(lane, lane[1:]))
+            for pid, start, end in lane:
+                assert start < end and start >= arrival[pid]
+                served[pid] = served.get(pid, 0) + end - start
+                segments.append((pid, start, end))
+        for p in processes:
+            assert served[p['PID']] == pytest.approx(p['BurstTime'])
+        # and a process never runs on two cores at once
+        segments.sort()
+        assert all(a[0] != b[0] or a[2] <= b[1] for a, b in zip(segments, segments[1:]))
+        for p in result:
+            own = [s for s in segments if s[0] == p['PID']]
+            assert p['StartTime'] == own[0][1] and p['CompletionTime'] == own[-1][2]
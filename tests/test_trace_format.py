@@ -0,0 +1,120 @@
+import struct
+
+import pytest
+
+import TraceFormat
+from SchedulingAlgorithms.Scheduling import ProcessTable, fcfs
+from WorkloadGenerator import generate_address_trace, generate_allocation_trace, generate_process_table
+
+
+def columns(table):
+    return [list(table.pid), list(table.arrival), list(table.burst), list(table.priority)]
+
+
+def test_process_trace_round_trip(tmp_path):
+    path = tmp_path / "procs.trace"
+    table = generate_process_table(500, seed=1)
+    TraceFormat.write_process_trace(path, table)
+    loaded = TraceFormat.read_process_table(path)
+    assert columns(loaded) == columns(table) and loaded.time_type == 'q'
+    assert fcfs(loaded)[0].to_dicts() == fcfs(table)[0].to_dicts()
+
+
+def test_process_trace_float_times(tmp_path):
+    path = tmp_path / "procs.trace"
+    table = ProcessTable.from_rows([{'PID': i, 'ArrivalTime': i / 4, 'BurstTime': 1.5, 'Priority': 2}
+                                    for i in range(10)])
+    TraceFormat.write_process_trace(path, table)
+    loaded = TraceFormat.read_process_table(path)
+    assert columns(loaded) == columns(table) and loaded.time_type == 'd'
+
+
+def test_process_trace_rejects_named_pids(tmp_path):
+    table = ProcessTable.from_rows([{'PID': 'A', 'ArrivalTime': 0, 'BurstTime': 1, 'Priority': 1}])
+    with pytest.raises(ValueError):
+        TraceFormat.write_process_trace(tmp_path / "procs.trace", table)
+
+
+def test_allocation_trace_round_trip(tmp_path):
+    path = tmp_path / "alloc.trace"
+    trace = generate_allocation_trace(300, seed=2)
+    TraceFormat.write_allocation_trace(path, trace)
+    loaded = TraceFormat.read_allocation_trace(path)
+    assert [list(column) for column in loaded] == [list(column) for column in trace]
+    assert loaded[0].format == 'b'
+
+
+def test_address_trace_round_trip(tmp_path):
+    path = tmp_path / "addr.trace"
+    addresses = generate_address_trace(1000, seed=3)
+    TraceFormat.write_address_trace(path, addresses)
+    assert list(TraceFormat.read_address_trace(path)) == list(addresses)
+    # Values past int32 widen the column to int64
+    wide = [0, 2 ** 40, -5]
+    TraceFormat.write_address_trace(path, wide)
+    loaded = TraceFormat.read_address_trace(path)
+    assert loaded.format == 'q' and list(loaded) == wide
+
+
+@pytest.mark.parametrize("kind", sorted(TraceFormat.KINDS))
+def test_empty_trace(kind, tmp_path):
+    path = tmp_path / "empty.trace"
+    names = TraceFormat.KINDS[kind][1]
+    TraceFormat.write_trace(path, kind, {name: [] for name in names})
+    found, loaded = TraceFormat.read_trace(path)
+    assert found == kind and list(loaded) == list(names)
+    assert all(len(column) == 0 for column in loaded.values())
+
+
+def test_write_rejects_bad_input(tmp_path):
+    with pytest.raises(ValueError):
+        TraceFormat.write_trace(tmp_path / "x.trace", "bogus", {})
+    with pytest.raises(ValueError):
+        TraceFormat.write_trace(tmp_path / "x.trace", "allocation", {"kind": [0], "pid": [1, 2], "size": [3]})
+
+
+def test_read_checks_kind(tmp_path):
+    path = tmp_path / "addr.trace"
+    TraceFormat.write_address_trace(path, [1, 2, 3])
+    with pytest.raises(ValueError, match="expected process trace"):
+        TraceFormat.read_process_table(path)
+
+
+def valid_trace(tmp_path):
+    path = tmp_path / "alloc.trace"
+    TraceFormat.write_allocation_trace(path, ([0, 1], [7, 7], [64, 0]))
+    return path.read_bytes()
+
+
+def corrupt(data, offset, fmt, value):
+    data = bytearray(data)
+    struct.pack_into(fmt, data, offset, value)
+    return data
+
+
+# Offsets into the header and the first directory entry
+KIND_AT = 6
+COUNT_AT = 16
+FIRST_COLUMN = TraceFormat.HEADER.size
+TYPECODE_AT = FIRST_COLUMN + 16
+OFFSET_AT = FIRST_COLUMN + 24
+
+
+@pytest.mark.parametrize("damage,message", [
+    (lambda d: d[:10], "too short"),
+    (lambda d: corrupt(d, 0, "<4s", b"JUNK"), "bad magic"),
+    (lambda d: corrupt(d, 4, "<H", 99), "unsupported trace version"),
+    (lambda d: corrupt(d, KIND_AT, "<H", 42), "unknown trace kind"),
+    (lambda d: corrupt(d, COUNT_AT, "<I", 1000), "truncated"),
+    (lambda d: corrupt(d, TYPECODE_AT, "<c", b"x"), "unsupported column type"),
+    (lambda d: corrupt(d, OFFSET_AT, "<Q", 1 << 20), "truncated"),
+    (lambda d: d[:-4], "truncated"),
+])
+def test_corrupted_trace(damage, message, tmp_path):
+    data = damage(valid_trace(tmp_path))
+    with pytest.raises(ValueError, match=message):
+        TraceFormat.parse_trace(data)
+    path = tmp_path / "bad.trace"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match=message):
+        TraceFormat.read_trace(path)